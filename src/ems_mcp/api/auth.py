@@ -5,6 +5,7 @@ OAuth 2.0 password grant flow.
 """
 
 import asyncio
+import contextlib
 import logging
 from datetime import UTC, datetime, timedelta
 
@@ -42,14 +43,22 @@ class TokenManager:
     APPLICATION_NAME = "ems-mcp"
     USER_AGENT = "ems-api-sdk python ems-mcp/0.1.0"
 
-    def __init__(self, settings: EMSSettings | None = None):
+    def __init__(
+        self,
+        settings: EMSSettings | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize TokenManager.
 
         Args:
             settings: Optional settings override. If not provided, loads from
                       environment variables.
+            http_client: Optional shared client for token requests. It is
+                         left open; the caller owns its lifetime. If not
+                         provided, each token request opens its own client.
         """
         self._settings = settings or get_settings()
+        self._http_client = http_client
         self._token: CachedToken | None = None
         self._token_lock = asyncio.Lock()
 
@@ -68,6 +77,15 @@ class TokenManager:
                     cls._instance = cls()
         return cls._instance
 
+    @classmethod
+    def set_instance(cls, manager: "TokenManager") -> None:
+        """Set the singleton TokenManager instance.
+
+        Args:
+            manager: The TokenManager instance to use as singleton.
+        """
+        cls._instance = manager
+
     @classmethod
     def reset_instance(cls) -> None:
         """Reset the singleton instance. Primarily for testing."""
@@ -120,8 +138,15 @@ class TokenManager:
 
         logger.debug("Requesting new token from %s", token_url)
 
+        # A shared client is borrowed without closing it on exit
+        client_context: contextlib.AbstractAsyncContextManager[httpx.AsyncClient] = (
+            contextlib.nullcontext(self._http_client)
+            if self._http_client is not None
+            else httpx.AsyncClient()
+        )
+
         try:
-            async with httpx.AsyncClient() as client:
+            async with client_context as client:
                 response = await client.post(
                     token_url,
                     headers=headers,
@@ -12,6 +12,11 @@ from typing import Any
 
 import httpx
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from ems_mcp.api.auth import AuthenticationError, TokenManager
 from ems_mcp.api.models import EMSErrorResponse, RetryConfig
 from ems_mcp.config import EMSSettings, get_settings
@@ -190,6 +195,19 @@ class EMSClient:
             EMSAPIError: On API errors.
             AuthenticationError: On authentication failures.
         """
+        if json is not None and orjson is not None:
+            try:
+                # Serialize once with orjson; the bytes are reused on retries
+                content = orjson.dumps(json)
+            except TypeError:
+                # orjson rejects ints wider than 64 bits and non-str dict keys;
+                # leave those bodies to the stdlib encoder.
+                pass
+            else:
+                headers = {"Content-Type": "application/json", **kwargs.pop("headers", {})}
+                return await self._request(
+                    "POST", path, content=content, headers=headers, **kwargs
+                )
         return await self._request("POST", path, json=json, **kwargs)
 
     async def _request(
@@ -224,14 +242,19 @@ class EMSClient:
         headers = self._token_manager.get_auth_headers()
         headers["Authorization"] = f"Bearer {token}"
 
-        # Merge with any provided headers
+        # Merge with any provided headers. kwargs itself is left intact so
+        # retries resend the same headers.
+        request_kwargs = kwargs
         if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+            request_kwargs = dict(kwargs)
+            headers.update(request_kwargs.pop("headers"))
 
         logger.debug("%s %s (attempt %d)", method, path, retry_count + 1)
 
         try:
-            response = await self._http_client.request(method, url, headers=headers, **kwargs)
+            response = await self._http_client.request(
+                method, url, headers=headers, **request_kwargs
+            )
             return await self._handle_response(response, method, path, retry_count, kwargs)
 
         except httpx.TimeoutException as e:
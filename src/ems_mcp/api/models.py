@@ -4,10 +4,11 @@ This module defines the data structures used for authentication tokens,
 error responses, and retry configuration.
 """
 
+import random
 from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class TokenResponse(BaseModel):
@@ -87,14 +88,32 @@ class RetryConfig(BaseModel):
     """Configuration for HTTP retry behavior.
 
     Implements exponential backoff with jitter for resilient API calls.
+    The capped delay for each attempt up to ``max_retries`` is computed once
+    at construction, so the model is frozen to keep it in step with the
+    fields.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     max_retries: int = Field(default=3, description="Maximum number of retry attempts")
     base_delay: float = Field(default=1.0, description="Base delay in seconds")
     max_delay: float = Field(default=30.0, description="Maximum delay in seconds")
     exponential_base: float = Field(default=2.0, description="Exponential backoff multiplier")
     jitter: bool = Field(default=True, description="Add random jitter to delays")
 
+    _delays: tuple[float, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the capped delay for every retry attempt."""
+        self._delays = tuple(self._capped_delay(i) for i in range(self.max_retries + 1))
+
+    def _capped_delay(self, attempt: int) -> float:
+        """Exponential delay for ``attempt``, capped at ``max_delay``."""
+        return min(
+            self.base_delay * (self.exponential_base**attempt),
+            self.max_delay,
+        )
+
     def get_delay(self, attempt: int) -> float:
         """Calculate delay for a given retry attempt.
 
@@ -104,12 +123,10 @@ class RetryConfig(BaseModel):
         Returns:
             Delay in seconds, with optional jitter.
         """
-        import random
-
-        delay = min(
-            self.base_delay * (self.exponential_base**attempt),
-            self.max_delay,
-        )
+        if 0 <= attempt < len(self._delays):
+            delay = self._delays[attempt]
+        else:
+            delay = self._capped_delay(attempt)
         if self.jitter:
             delay = delay * (0.5 + random.random())
         return delay
@@ -6,40 +6,43 @@ and benefit from caching.
 """
 
 import asyncio
+import heapq
 import logging
-from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
-from typing import Any, Generic, TypeVar
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any, Generic, NamedTuple, TypeVar
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
-@dataclass
-class CacheEntry(Generic[T]):
+class CacheEntry(NamedTuple, Generic[T]):
     """A cached value with expiry tracking.
 
+    A named tuple keeps per-entry overhead to two slots. The expiry is a
+    reading of the owning cache's nanosecond clock (``time.monotonic_ns`` by
+    default), so ``SimpleCache`` checks it with a single integer comparison.
+
     Attributes:
         value: The cached value.
-        expires_at: When this entry expires (UTC).
-        created_at: When this entry was created (UTC).
+        expires_at_ns: Monotonic time in nanoseconds when this entry expires.
     """
 
     value: T
-    expires_at: datetime
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-
-    @property
-    def is_expired(self) -> bool:
-        """Check if this cache entry has expired."""
-        return datetime.now(UTC) >= self.expires_at
+    expires_at_ns: int
 
 
 class SimpleCache(Generic[T]):
     """Simple async-safe in-memory cache with TTL support.
 
-    Thread-safe for concurrent async access using asyncio.Lock.
+    Reads take no lock: they never await, so they cannot interleave with a
+    write on the event loop. Writes are serialized with asyncio.Lock. At
+    capacity the least recently used entry is evicted, in O(1). Expired
+    entries are swept in one pass from a min-heap of expiry times on every
+    ``set``, so they do not linger until read again.
 
     Example:
         cache = SimpleCache[dict](default_ttl=3600)
@@ -47,16 +50,27 @@ class SimpleCache(Generic[T]):
         result = await cache.get("key")
     """
 
-    def __init__(self, default_ttl: int = 3600, max_entries: int = 10000):
+    def __init__(
+        self,
+        default_ttl: int = 3600,
+        max_entries: int = 10000,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ):
         """Initialize the cache.
 
         Args:
             default_ttl: Default time-to-live in seconds.
             max_entries: Maximum number of entries before eviction.
+            clock: Nanosecond clock used for expiry. Tests can inject a
+                   virtual clock to expire entries without sleeping.
         """
         self._default_ttl = default_ttl
         self._max_entries = max_entries
-        self._cache: dict[str, CacheEntry[T]] = {}
+        self._clock = clock
+        # Ordered from least to most recently used
+        self._cache: OrderedDict[str, CacheEntry[T]] = OrderedDict()
+        # (expires_at_ns, key) for every set; stale pairs are skipped on pop
+        self._expiry_heap: list[tuple[int, str]] = []
         self._lock = asyncio.Lock()
 
     async def get(self, key: str) -> T | None:
@@ -68,16 +82,16 @@ class SimpleCache(Generic[T]):
         Returns:
             The cached value, or None if not found or expired.
         """
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
-            if entry.is_expired:
-                del self._cache[key]
-                logger.debug("Cache miss (expired): %s", key)
-                return None
-            logger.debug("Cache hit: %s", key)
-            return entry.value
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if self._clock() >= entry.expires_at_ns:
+            self._cache.pop(key, None)
+            logger.debug("Cache miss (expired): %s", key)
+            return None
+        self._cache.move_to_end(key)
+        logger.debug("Cache hit: %s", key)
+        return entry.value
 
     async def set(self, key: str, value: T, ttl: int | None = None) -> None:
         """Set a value in the cache.
@@ -88,21 +102,20 @@ class SimpleCache(Generic[T]):
             ttl: Time-to-live in seconds. Uses default if not specified.
         """
         ttl = ttl if ttl is not None else self._default_ttl
-        expires_at = datetime.now(UTC).replace(microsecond=0) + timedelta(seconds=ttl)
+        expires_at_ns = self._clock() + ttl * 1_000_000_000
 
         async with self._lock:
-            # Evict expired entries if at capacity
-            if len(self._cache) >= self._max_entries:
-                await self._evict_expired_unlocked()
-
-            # If still at capacity, evict oldest entries (at least 1)
-            if len(self._cache) >= self._max_entries:
-                evict_count = max(1, len(self._cache) // 10)
-                await self._evict_oldest_unlocked(evict_count)
-
-            self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
+            self._sweep_unlocked()
+            self._cache[key] = CacheEntry(value, expires_at_ns)
+            self._cache.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (expires_at_ns, key))
             logger.debug("Cache set: %s (TTL: %ds)", key, ttl)
 
+            # Evict least recently used entries beyond capacity
+            while len(self._cache) > self._max_entries:
+                evicted_key, _ = self._cache.popitem(last=False)
+                logger.debug("Cache evict (LRU): %s", evicted_key)
+
     async def delete(self, key: str) -> bool:
         """Delete a value from the cache.
 
@@ -123,35 +136,42 @@ class SimpleCache(Generic[T]):
         """Clear all entries from the cache."""
         async with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
             logger.debug("Cache cleared")
 
-    async def _evict_expired_unlocked(self) -> int:
-        """Evict expired entries. Must be called with lock held.
+    async def sweep(self) -> int:
+        """Remove all expired entries now.
 
         Returns:
-            Number of entries evicted.
+            Number of entries removed.
         """
-        expired_keys = [k for k, v in self._cache.items() if v.is_expired]
-        for key in expired_keys:
-            del self._cache[key]
-        if expired_keys:
-            logger.debug("Evicted %d expired cache entries", len(expired_keys))
-        return len(expired_keys)
+        async with self._lock:
+            return self._sweep_unlocked()
 
-    async def _evict_oldest_unlocked(self, count: int) -> None:
-        """Evict oldest entries. Must be called with lock held.
+    def _sweep_unlocked(self) -> int:
+        """Pop expired heap entries and delete them. Must be called with lock held.
 
-        Args:
-            count: Number of entries to evict.
+        Returns:
+            Number of entries removed.
         """
-        if not self._cache:
-            return
+        now_ns = self._clock()
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] <= now_ns:
+            expires_at_ns, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip pairs left behind by overwrites, deletes and LRU evictions
+            if entry is not None and entry.expires_at_ns == expires_at_ns:
+                del self._cache[key]
+                removed += 1
+        if removed:
+            logger.debug("Swept %d expired cache entries", removed)
 
-        # Sort by creation time and remove oldest
-        sorted_entries = sorted(self._cache.items(), key=lambda x: x[1].created_at)
-        for key, _ in sorted_entries[:count]:
-            del self._cache[key]
-        logger.debug("Evicted %d oldest cache entries", min(count, len(sorted_entries)))
+        # Rebuild once stale pairs outnumber live entries
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(e.expires_at_ns, k) for k, e in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+        return removed
 
     @property
     def size(self) -> int:
@@ -165,13 +185,77 @@ database_cache: SimpleCache[Any] = SimpleCache(default_ttl=3600)
 asset_cache: SimpleCache[Any] = SimpleCache(default_ttl=3600)
 
 
+# In-flight lookups by cache key, shared by concurrent callers
+_inflight: dict[str, asyncio.Future[Any]] = {}
+
+
+async def singleflight(key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+    """Run ``fetch`` once per key, sharing its outcome with concurrent callers.
+
+    A caller that arrives while a lookup for the same key is already in
+    flight awaits that lookup instead of issuing a duplicate API request.
+    If the leading caller is cancelled, its waiters are not: they retry the
+    lookup, one of them becoming the new leader.
+
+    Example:
+        value = await singleflight(cache_key, fetch_and_cache)
+
+    Args:
+        key: Cache key identifying the lookup.
+        fetch: Coroutine factory performing the lookup (and caching it).
+
+    Returns:
+        The value produced by ``fetch``.
+    """
+    while (existing := _inflight.get(key)) is not None:
+        try:
+            return await asyncio.shield(existing)
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if not existing.cancelled() or (task is not None and task.cancelling()):
+                # This caller was cancelled itself
+                raise
+            # The leader was cancelled, not us: retry, possibly as the new leader
+
+    future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        value = await fetch()
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception retrieved in case no other caller was waiting
+        future.exception()
+        raise
+    else:
+        future.set_result(value)
+        return value
+    finally:
+        # Cancellation or another BaseException: release the waiters to retry
+        if not future.done():
+            future.cancel()
+        del _inflight[key]
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _cached_key(*args: Any) -> str:
+    """Join hashable key parts; ``typed`` keeps ``1`` and ``True`` apart."""
+    return ":".join(map(str, args))
+
+
 def make_cache_key(*args: Any) -> str:
     """Create a cache key from multiple arguments.
 
+    Keys built from hashable arguments are memoized, so repeated lookups
+    return the same string object without re-formatting it.
+
     Args:
         *args: Values to include in the key.
 
     Returns:
         A string cache key.
     """
-    return ":".join(str(arg) for arg in args)
+    try:
+        return _cached_key(*args)
+    except TypeError:
+        # Unhashable argument (e.g. a list); build the key directly
+        return ":".join(map(str, args))
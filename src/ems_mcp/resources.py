@@ -80,7 +80,7 @@ async def systems_resource() -> str:
     try:
         client = get_client()
         systems = await client.get("/api/v2/ems-systems")
-        result = json.dumps(systems, indent=2)
+        result = json.dumps(systems, indent=2, ensure_ascii=False)
         await asset_cache.set(cache_key, result)
         return result
     except EMSAPIError as e:
@@ -100,7 +100,7 @@ async def fleets_resource(system_id: int) -> str:
     try:
         client = get_client()
         fleets = await client.get(f"/api/v2/ems-systems/{system_id}/assets/fleets")
-        result = json.dumps(fleets, indent=2)
+        result = json.dumps(fleets, indent=2, ensure_ascii=False)
         await asset_cache.set(cache_key, result)
         return result
     except EMSAPIError as e:
@@ -120,7 +120,7 @@ async def airports_resource(system_id: int) -> str:
     try:
         client = get_client()
         airports = await client.get(f"/api/v2/ems-systems/{system_id}/assets/airports")
-        result = json.dumps(airports, indent=2)
+        result = json.dumps(airports, indent=2, ensure_ascii=False)
         await asset_cache.set(cache_key, result)
         return result
     except EMSAPIError as e:
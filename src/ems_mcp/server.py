@@ -9,6 +9,7 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 
+import anyio
 from fastmcp import FastMCP
 
 from ems_mcp.api.client import EMSClient
@@ -114,13 +115,32 @@ def get_client() -> EMSClient:
     return EMSClient.get_instance()
 
 
+def _event_loop_options() -> dict[str, Any]:
+    """Build anyio backend options, using uvloop when it is installed.
+
+    uvloop is an optional dependency (the ``speedups`` extra). It is handed
+    to anyio as the loop factory rather than installed as an event loop
+    policy, since the policy API is deprecated as of Python 3.14. When it is
+    not available the default asyncio event loop is used.
+
+    Returns:
+        Backend options for ``anyio.run``.
+    """
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return {}
+    logger.debug("Using uvloop event loop")
+    return {"use_uvloop": True}
+
+
 def run() -> None:
     """Run the MCP server.
 
     This is the main entry point for starting the server.
-    Uses stdio transport by default.
+    Uses stdio transport by default, and uvloop when it is installed.
     """
-    mcp.run()
+    anyio.run(mcp.run_async, backend_options=_event_loop_options())
 
 
 # Import tools and resources to register them with the mcp instance
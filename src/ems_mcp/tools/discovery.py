@@ -3,6 +3,9 @@
 These tools enable LLMs to discover EMS systems, databases, fields, and analytics.
 Discovery must be performed before querying data, as field and analytic IDs are
 opaque strings that cannot be constructed manually.
+
+Deep field search issues many small sequential requests, so it benefits most
+from the optional ``uvloop`` event loop (see ``ems_mcp.server.run``).
 """
 
 import logging
@@ -11,7 +14,7 @@ from collections import deque
 from typing import Any, Literal
 
 from ems_mcp.api.client import EMSAPIError, EMSNotFoundError
-from ems_mcp.cache import database_cache, field_cache, make_cache_key
+from ems_mcp.cache import database_cache, field_cache, make_cache_key, singleflight
 from ems_mcp.server import get_client, mcp
 
 logger = logging.getLogger(__name__)
@@ -133,6 +136,33 @@ async def _resolve_field_id(
     if cached is not None:
         return cached
 
+    # Concurrent lookups of the same name share one search
+    return await singleflight(
+        cache_key,
+        lambda: _search_field_id(field_ref, ems_system_id, database_id, cache_key),
+    )
+
+
+async def _search_field_id(
+    field_ref: str,
+    ems_system_id: int,
+    database_id: str,
+    cache_key: str,
+) -> str:
+    """Search for a field by name and cache the resolved ID.
+
+    Args:
+        field_ref: Human-readable field name (stripped).
+        ems_system_id: The EMS system ID for API lookups.
+        database_id: The database ID for API lookups.
+        cache_key: Cache key to store the resolved ID under.
+
+    Returns:
+        The resolved opaque field ID string.
+
+    Raises:
+        ValueError: If the name is not found or is ambiguous.
+    """
     client = get_client()
 
     # Entity-type databases don't support the field search endpoint (405);
@@ -583,6 +613,37 @@ def _format_deep_search_results(
 # ---------------------------------------------------------------------------
 
 
+async def _safe_get(
+    path: str,
+    *,
+    label: str,
+    not_found_msg: str | None = None,
+    **kwargs: Any,
+) -> tuple[Any, str | None]:
+    """Perform a GET request, converting API errors into tool error messages.
+
+    Args:
+        path: API path to request.
+        label: Action description used in generic errors, e.g. ``"listing databases"``
+            produces ``"Error listing databases: <message>"``.
+        not_found_msg: Message to return on 404. If None, a 404 is reported
+            like any other API error.
+        **kwargs: Additional arguments passed to ``client.get``.
+
+    Returns:
+        ``(response, None)`` on success, or ``(None, error_message)`` on failure.
+    """
+    client = get_client()
+    try:
+        return await client.get(path, **kwargs), None
+    except EMSNotFoundError as e:
+        if not_found_msg is not None:
+            return None, not_found_msg
+        return None, f"Error {label}: {e.message}"
+    except EMSAPIError as e:
+        return None, f"Error {label}: {e.message}"
+
+
 async def _fetch_field_group(
     client: Any,
     ems_system_id: int,
@@ -648,6 +709,9 @@ async def _recursive_field_search(
     # BFS queue entries: (group_id_or_None, depth, path_parts)
     queue: deque[tuple[str | None, int, list[str]]] = deque()
     queue.append((None, 0, []))
+    # Group IDs already enqueued. The hierarchy may link the same group from
+    # several parents; visiting it once keeps max_groups spent on new groups.
+    visited: set[str] = set()
 
     while queue and len(matches) < max_results:
         if groups_visited >= max_groups:
@@ -686,7 +750,8 @@ async def _recursive_field_search(
         if depth < max_depth:
             for sub in group.get("groups", []):
                 sub_id = sub.get("id")
-                if sub_id:
+                if sub_id and sub_id not in visited:
+                    visited.add(sub_id)
                     sub_name_lower = sub.get("name", "").lower()
                     entry = (sub_id, depth + 1, current_path)
                     # Prioritize groups whose name contains a search word
@@ -725,7 +790,8 @@ async def _do_browse_fields(
     cache_key = make_cache_key("field_group", ems_system_id, database_id, group_id or "root")
     cached = await field_cache.get(cache_key)
     if cached is not None:
-        logger.debug("Using cached field group: %s", cache_key)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using cached field group: %s", cache_key)
         return _format_field_group(cached)
 
     try:
@@ -790,7 +856,8 @@ async def _do_search_fields(
     cache_key = make_cache_key("field_search", ems_system_id, database_id, search_text.lower())
     cached = await field_cache.get(cache_key)
     if cached is not None:
-        logger.debug("Using cached field search: %s", cache_key)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using cached field search: %s", cache_key)
         return _format_field_search_results(cached[:max_results], show_ids=show_ids)
 
     try:
@@ -885,13 +952,18 @@ async def list_ems_systems() -> str:
     Returns:
         EMS systems with IDs, names, and descriptions.
     """
-    client = get_client()
+    cache_key = make_cache_key("ems_systems")
+    cached = await database_cache.get(cache_key)
+    if cached is not None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using cached EMS systems: %s", cache_key)
+        return _format_ems_systems(cached)
 
-    try:
-        systems = await client.get("/api/v2/ems-systems")
-        return _format_ems_systems(systems)
-    except EMSAPIError as e:
-        return f"Error listing EMS systems: {e.message}"
+    result, error = await _safe_get("/api/v2/ems-systems", label="listing EMS systems")
+    if error is not None:
+        return error
+    await database_cache.set(cache_key, result)
+    return _format_ems_systems(result)
 
 
 @mcp.tool
@@ -910,26 +982,28 @@ async def list_databases(
     Returns:
         Databases and subgroups at the specified level.
     """
-    client = get_client()
-
     cache_key = make_cache_key("database_group", ems_system_id, group_id or "root")
     cached = await database_cache.get(cache_key)
     if cached is not None:
-        logger.debug("Using cached database group: %s", cache_key)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using cached database group: %s", cache_key)
         return _format_database_group(cached)
 
-    try:
-        path = f"/api/v2/ems-systems/{ems_system_id}/database-groups"
-        if group_id:
-            path += f"?groupId={group_id}"
+    path = f"/api/v2/ems-systems/{ems_system_id}/database-groups"
+    if group_id:
+        path += f"?groupId={group_id}"
 
-        group = await client.get(path)
-        await database_cache.set(cache_key, group)
-        return _format_database_group(group)
-    except EMSNotFoundError:
-        return f"Error: Database group not found. Verify ems_system_id={ems_system_id} is valid."
-    except EMSAPIError as e:
-        return f"Error listing databases: {e.message}"
+    result, error = await _safe_get(
+        path,
+        label="listing databases",
+        not_found_msg=(
+            f"Error: Database group not found. Verify ems_system_id={ems_system_id} is valid."
+        ),
+    )
+    if error is not None:
+        return error
+    await database_cache.set(cache_key, result)
+    return _format_database_group(result)
 
 
 @mcp.tool
@@ -1025,30 +1099,28 @@ async def get_field_info(
     except (ValueError, EMSAPIError) as e:
         return f"Error resolving field: {e}"
 
-    client = get_client()
-
     cache_key = make_cache_key("field_info", ems_system_id, database_id, field_id)
     cached = await field_cache.get(cache_key)
     if cached is not None:
-        logger.debug("Using cached field info: %s", cache_key)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using cached field info: %s", cache_key)
         return _format_field_info(cached)
 
-    try:
-        encoded_field_id = urllib.parse.quote(field_id, safe="")
-        path = (
-            f"/api/v2/ems-systems/{ems_system_id}/databases/{database_id}/fields/{encoded_field_id}"
-        )
+    encoded_field_id = urllib.parse.quote(field_id, safe="")
+    path = f"/api/v2/ems-systems/{ems_system_id}/databases/{database_id}/fields/{encoded_field_id}"
 
-        field = await client.get(path)
-        await field_cache.set(cache_key, field)
-        return _format_field_info(field)
-    except EMSNotFoundError:
-        return (
+    result, error = await _safe_get(
+        path,
+        label="getting field info",
+        not_found_msg=(
             "Error: Field not found. Verify field_id is correct. "
             "Use find_fields to find valid field IDs."
-        )
-    except EMSAPIError as e:
-        return f"Error getting field info: {e.message}"
+        ),
+    )
+    if error is not None:
+        return error
+    await field_cache.set(cache_key, result)
+    return _format_field_info(result)
 
 
 @mcp.tool
@@ -1074,29 +1146,33 @@ async def search_analytics(
     Returns:
         Matching analytics with names, types, units, and descriptions.
     """
-    client = get_client()
-
     cache_key = make_cache_key(
         "analytics_search", ems_system_id, search_text.lower(), group_id or "all"
     )
     cached = await field_cache.get(cache_key)
     if cached is not None:
-        logger.debug("Using cached analytics search: %s", cache_key)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using cached analytics search: %s", cache_key)
         return _format_analytics_search_results(cached[:max_results], show_ids=show_ids)
 
-    try:
-        path = f"/api/v2/ems-systems/{ems_system_id}/analytics"
-        params: dict[str, str] = {"text": search_text}
-        if group_id:
-            params["groupId"] = group_id
-
-        analytics = await client.get(path, params=params)
-        await field_cache.set(cache_key, analytics)
-        return _format_analytics_search_results(analytics[:max_results], show_ids=show_ids)
-    except EMSNotFoundError:
-        return f"Error: EMS system {ems_system_id} not found. Use list_ems_systems to find valid system IDs."
-    except EMSAPIError as e:
-        return f"Error searching analytics: {e.message}"
+    path = f"/api/v2/ems-systems/{ems_system_id}/analytics"
+    params: dict[str, str] = {"text": search_text}
+    if group_id:
+        params["groupId"] = group_id
+
+    result, error = await _safe_get(
+        path,
+        label="searching analytics",
+        not_found_msg=(
+            f"Error: EMS system {ems_system_id} not found. "
+            "Use list_ems_systems to find valid system IDs."
+        ),
+        params=params,
+    )
+    if error is not None:
+        return error
+    await field_cache.set(cache_key, result)
+    return _format_analytics_search_results(result[:max_results], show_ids=show_ids)
 
 
 @mcp.tool
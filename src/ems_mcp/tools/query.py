@@ -4,17 +4,34 @@ These tools enable LLMs to query flight records from the Flight Data Warehouse
 and retrieve time-series analytics data for individual flights.
 """
 
+import asyncio
+import base64
 import csv
 import io
 import json
 import logging
 import re
+import time
+import urllib.parse
+from collections.abc import Callable, Iterable
+from functools import lru_cache, partial
+from itertools import chain, repeat
 from typing import Any, Literal, NotRequired, TypedDict
 
 from fastmcp import Context
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 from ems_mcp.api.client import EMSAPIError, EMSNotFoundError
-from ems_mcp.cache import field_cache, make_cache_key
+from ems_mcp.cache import field_cache, make_cache_key, singleflight
 from ems_mcp.server import get_client, mcp
 from ems_mcp.tools.discovery import _resolve_database_id, _resolve_field_id
 
@@ -37,13 +54,64 @@ VALID_OPERATORS = frozenset(
     }
 )
 
+# Maximum number of per-flight analytics queries in flight at once
+_MAX_CONCURRENT_FLIGHT_QUERIES = 5
+
+# query_database only reports progress once it has been running this long
+# (seconds), so fast queries skip the transport round-trips entirely
+_PROGRESS_MIN_ELAPSED = 0.25
+
 # Operators that take no value argument
 UNARY_OPERATORS = frozenset({"isNull", "isNotNull"})
 
-# Pattern for bracket-encoded analytic IDs: starts with [-hub-] or has [...][...] pattern
-_BRACKET_ID_PATTERN = re.compile(r"^\[-hub-\]|^\[.+?\]\[.+?\]")
+# TTL (seconds) for cached analytic name misses, so retries of a bad name
+# short-circuit without hiding newly added analytics for long
+_NEGATIVE_CACHE_TTL = 30
+
+# Compact JSON encoder shared by the JSON output formatters. Non-ASCII text
+# (airport names, registrations) is kept as-is, matching orjson's output.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _json_encode(obj: Any) -> str:
+    """Encode a value as compact JSON, using orjson when it is installed.
+
+    Args:
+        obj: The value to encode.
+
+    Returns:
+        The JSON text.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return _JSON_ENCODER.encode(obj)
+
+
+def _json_encode_array(items: Iterable[Any]) -> str:
+    """Encode an iterable of values as a compact JSON array.
+
+    With orjson the items are collected and encoded in one call. Without
+    it, each item is encoded as it is produced.
+
+    Args:
+        items: The values to encode, typically a generator of row dicts.
+
+    Returns:
+        The JSON array text.
+    """
+    if orjson is not None:
+        return orjson.dumps(list(items)).decode()
+    return f"[{','.join(map(_JSON_ENCODER.encode, items))}]"
+
 
+# Prefixes that identify a raw analytic ID outright
+_ANALYTIC_ID_PREFIXES = ("H4sIA", "[-hub-]")
 
+# Pattern for the individual [...] segments of a bracket-encoded ID
+_BRACKET_SEGMENT_PATTERN = re.compile(r"\[([^\]]+)\]")
+
+
+@lru_cache(maxsize=1024)
 def _is_analytic_id(value: str) -> bool:
     """Check if a string looks like a raw analytic ID rather than a human-readable name.
 
@@ -57,14 +125,61 @@ def _is_analytic_id(value: str) -> bool:
     Returns:
         True if the string looks like a raw analytic ID.
     """
-    if not value or not value.strip():
-        return False
     value = value.strip()
-    if value.startswith("H4sIA"):
-        return True
-    if _BRACKET_ID_PATTERN.match(value):
+    # The shortest raw ID is the bare "H4sIA" prefix
+    if len(value) < 5:
+        return False
+    if value.startswith(_ANALYTIC_ID_PREFIXES):
         return True
-    return False
+    if not value.startswith("["):
+        return False
+    # Bracket-encoded "[...][...]": after the opening "[", a "][" preceded by
+    # at least one character, then at least one more character and a "]",
+    # all on the first line.
+    line = value.partition("\n")[0]
+    i = line.find("][", 2)
+    return i != -1 and line.find("]", i + 3) != -1
+
+
+def _match_analytic(item: str, search_results: list[dict[str, Any]]) -> tuple[str, str]:
+    """Pick the analytic matching ``item`` from analytics search results.
+
+    Args:
+        item: The human-readable analytic name that was searched for.
+        search_results: Results from the analytics search API.
+
+    Returns:
+        The (display_name, analytic_id) pair for the match.
+
+    Raises:
+        ValueError: If there are no results, or several with no exact match.
+    """
+    if not search_results:
+        raise ValueError(
+            f"Analytic not found: '{item}'. "
+            "Use search_analytics to find valid analytic names."
+        )
+
+    # Try exact name match (case-insensitive)
+    exact_matches = [
+        a for a in search_results
+        if a.get("name", "").lower() == item.lower()
+    ]
+    if len(exact_matches) == 1:
+        return (exact_matches[0]["name"], exact_matches[0]["id"])
+
+    # If only one result total, use it
+    if len(search_results) == 1:
+        return (search_results[0]["name"], search_results[0]["id"])
+
+    # Multiple matches with no exact match - ambiguous
+    match_names = [a.get("name", "?") for a in search_results[:5]]
+    raise ValueError(
+        f"Ambiguous analytic name: '{item}'. "
+        f"Multiple matches found: {', '.join(match_names)}"
+        f"{'...' if len(search_results) > 5 else ''}. "
+        "Use a more specific name or use search_analytics to find the exact name."
+    )
 
 
 async def _resolve_analytics(
@@ -75,6 +190,9 @@ async def _resolve_analytics(
 
     For raw IDs (bracket-encoded or compressed), passes them through as-is.
     For human-readable names, searches the analytics API and matches by name.
+    Names missing from the cache are searched concurrently. Names that could
+    not be resolved are remembered briefly so retries fail fast, and a fully
+    resolved list is cached as a whole for repeated identical requests.
 
     Args:
         names_or_ids: List of analytic names or raw IDs.
@@ -86,67 +204,67 @@ async def _resolve_analytics(
     Raises:
         ValueError: If a name cannot be resolved (not found or ambiguous).
     """
-    client = get_client()
-    results: list[tuple[str, str]] = []
+    items = [item.strip() for item in names_or_ids]
+    # The tuple's repr keeps the key unambiguous for names containing ":"
+    bulk_key = make_cache_key("analytic_resolve_bulk", ems_system_id, tuple(items))
+    cached_pairs = await field_cache.get(bulk_key)
+    if cached_pairs is not None:
+        return list(cached_pairs)
 
-    for item in names_or_ids:
-        item = item.strip()
+    results: list[tuple[str, str] | None] = [None] * len(items)
+    pending: list[tuple[int, str, str]] = []
+
+    for idx, item in enumerate(items):
         if _is_analytic_id(item):
-            results.append((item, item))
+            results[idx] = (item, item)
             continue
 
         # Check cache first
         cache_key = make_cache_key("analytic_resolve", ems_system_id, item.lower())
         cached = await field_cache.get(cache_key)
+        if isinstance(cached, str):
+            # Recent not-found / ambiguous outcome, cached as its error message
+            raise ValueError(cached)
         if cached is not None:
-            results.append(cached)
+            results[idx] = cached
             continue
 
-        # Search the analytics API
-        path = f"/api/v2/ems-systems/{ems_system_id}/analytics"
-        params = {"text": item}
-        search_results = await client.get(path, params=params)
+        pending.append((idx, item, cache_key))
 
-        if not search_results:
-            raise ValueError(
-                f"Analytic not found: '{item}'. "
-                "Use search_analytics to find valid analytic names."
-            )
-
-        # Try exact name match (case-insensitive)
-        exact_matches = [
-            a for a in search_results
-            if a.get("name", "").lower() == item.lower()
-        ]
-        if len(exact_matches) == 1:
-            pair = (exact_matches[0]["name"], exact_matches[0]["id"])
-            await field_cache.set(cache_key, pair)
-            results.append(pair)
-            continue
+    if pending:
+        # Search the analytics API for all misses at once
+        client = get_client()
+        path = f"/api/v2/ems-systems/{ems_system_id}/analytics"
 
-        # If only one result total, use it
-        if len(search_results) == 1:
-            pair = (search_results[0]["name"], search_results[0]["id"])
+        async def search(item: str, cache_key: str) -> tuple[str, str]:
+            search_results = await client.get(path, params={"text": item})
+            try:
+                pair = _match_analytic(item, search_results)
+            except ValueError as e:
+                await field_cache.set(cache_key, str(e), ttl=_NEGATIVE_CACHE_TTL)
+                raise
             await field_cache.set(cache_key, pair)
-            results.append(pair)
-            continue
+            return pair
 
-        # Multiple matches with no exact match - ambiguous
-        match_names = [a.get("name", "?") for a in search_results[:5]]
-        raise ValueError(
-            f"Ambiguous analytic name: '{item}'. "
-            f"Multiple matches found: {', '.join(match_names)}"
-            f"{'...' if len(search_results) > 5 else ''}. "
-            "Use a more specific name or use search_analytics to find the exact name."
+        pairs = await asyncio.gather(
+            *(
+                singleflight(cache_key, partial(search, item, cache_key))
+                for _, item, cache_key in pending
+            )
         )
+        for (idx, _, _), pair in zip(pending, pairs, strict=True):
+            results[idx] = pair
 
-    return results
+    await field_cache.set(bulk_key, tuple(results))
+    return results  # type: ignore[return-value]
 
 
+@lru_cache(maxsize=1024)
 def _format_analytic_header(analytic_id: str) -> str:
     """Format a raw analytic ID for use as a column header.
 
     Truncates long bracket-encoded IDs to the last meaningful segment.
+    Results are memoized since the same IDs recur across flights.
 
     Args:
         analytic_id: The raw analytic ID string.
@@ -157,7 +275,7 @@ def _format_analytic_header(analytic_id: str) -> str:
     if analytic_id.startswith("H4sIA"):
         return analytic_id[:12] + "..."
     # For bracket IDs, try to extract the last bracket segment
-    segments = re.findall(r"\[([^\]]+)\]", analytic_id)
+    segments = _BRACKET_SEGMENT_PATTERN.findall(analytic_id)
     if segments:
         return segments[-1]
     return analytic_id
@@ -165,6 +283,10 @@ def _format_analytic_header(analytic_id: str) -> str:
 
 VALID_AGGREGATES = frozenset({"avg", "count", "max", "min", "stdev", "sum", "var"})
 
+# Sorted, comma-separated listings for validation error messages
+_VALID_AGGREGATES_TEXT = ", ".join(sorted(VALID_AGGREGATES))
+_VALID_OPERATORS_TEXT = ", ".join(sorted(VALID_OPERATORS))
+
 
 class QueryField(TypedDict):
     """A field to include in query results."""
@@ -203,6 +325,60 @@ class QueryOrderBy(TypedDict):
     direction: NotRequired[Literal["asc", "desc"]]
 
 
+def _with_resolved_ids(items: list[Any], field_ids: dict[str | int, str]) -> list[Any]:
+    """Copy field/filter/order_by entries with their field_id replaced.
+
+    The caller's dicts are left untouched; each entry is shallow-copied
+    with ``dict()`` and updated in place.
+
+    Args:
+        items: Entries with a ``field_id`` key.
+        field_ids: Mapping of original references to resolved field IDs.
+
+    Returns:
+        New list of entries with resolved field IDs.
+    """
+    resolved = []
+    for item in items:
+        copy = dict(item)
+        copy["field_id"] = field_ids[item["field_id"]]
+        resolved.append(copy)
+    return resolved
+
+
+async def _resolve_field_refs(
+    refs: Iterable[str | int],
+    ems_system_id: int,
+    database_id: str,
+) -> dict[str | int, str | ValueError | EMSAPIError]:
+    """Resolve field references to opaque field IDs, concurrently.
+
+    Each distinct reference is resolved once. Resolution failures are
+    returned in place of the ID so the caller can report which part of the
+    query the bad reference came from.
+
+    Args:
+        refs: Field references (result store numbers, IDs, or names).
+        ems_system_id: The EMS system ID.
+        database_id: The database ID.
+
+    Returns:
+        Mapping of each reference to its field ID, or to the ValueError /
+        EMSAPIError raised while resolving it.
+    """
+    unique_refs = list(dict.fromkeys(refs))
+    outcomes = await asyncio.gather(
+        *(_resolve_field_id(ref, ems_system_id, database_id) for ref in unique_refs),
+        return_exceptions=True,
+    )
+    resolved: dict[str | int, str | ValueError | EMSAPIError] = {}
+    for ref, outcome in zip(unique_refs, outcomes, strict=True):
+        if not isinstance(outcome, (str, ValueError, EMSAPIError)):
+            raise outcome
+        resolved[ref] = outcome
+    return resolved
+
+
 async def _get_field_metadata(
     ems_system_id: int,
     database_id: str,
@@ -221,8 +397,6 @@ async def _get_field_metadata(
     Returns:
         Raw field metadata dict from the API.
     """
-    import urllib.parse
-
     cache_key = make_cache_key("field_info", ems_system_id, database_id, field_id)
     cached = await field_cache.get(cache_key)
     if cached is not None:
@@ -234,76 +408,100 @@ async def _get_field_metadata(
         f"/api/v2/ems-systems/{ems_system_id}/databases/{database_id}"
         f"/fields/{encoded_field_id}"
     )
-    field_meta = await client.get(path)
-    await field_cache.set(cache_key, field_meta)
-    return field_meta
 
+    async def fetch() -> dict[str, Any]:
+        field_meta = await client.get(path)
+        await field_cache.set(cache_key, field_meta)
+        return field_meta
 
-async def _resolve_discrete_filter_value(
-    value: object,
-    field_id: str,
+    return await singleflight(cache_key, fetch)
+
+
+async def _get_field_label_index(
     ems_system_id: int,
     database_id: str,
-) -> object:
-    """Resolve a string filter value to its numeric code for discrete fields.
+    field_id: str,
+) -> dict[str, tuple[str, object]]:
+    """Build a lowercase-label lookup for a discrete field, with caching.
 
-    If the value is not a string, it is returned as-is. If the field is not
-    discrete, the string is returned as-is. Otherwise, the field's discrete
-    value mappings are looked up and the label is matched case-insensitively.
+    Normalizes the dict and list forms of ``discreteValues`` and converts
+    string-encoded integer codes once, so each label lookup is a dict hit.
 
     Args:
-        value: The filter value (may be string, int, etc.).
-        field_id: The field ID being filtered on.
         ems_system_id: The EMS system ID.
         database_id: The database ID.
+        field_id: The field ID.
 
     Returns:
-        The resolved numeric code, or the original value if not applicable.
-
-    Raises:
-        ValueError: If the string label is not found in discrete values.
+        Mapping of lowercased label to ``(label, code)``. Empty if the field
+        is not discrete, has no discrete values, or its metadata could not
+        be fetched.
     """
-    if not isinstance(value, str):
-        return value
+    cache_key = make_cache_key("field_label_idx", ems_system_id, database_id, field_id)
+    cached: dict[str, tuple[str, object]] | None = await field_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
         meta = await _get_field_metadata(ems_system_id, database_id, field_id)
     except EMSAPIError:
-        # If we can't fetch metadata, pass the value through and let the API
+        # If we can't fetch metadata, pass values through and let the API
         # return its own error.
-        return value
-
-    field_type = meta.get("type", "")
-    if field_type != "discrete":
-        return value
+        return {}
 
+    index: dict[str, tuple[str, object]] = {}
     discrete_values = meta.get("discreteValues")
-    if not discrete_values:
-        return value
-
-    # Normalize to list of {value, label} dicts
-    if isinstance(discrete_values, dict):
-        entries = [{"value": k, "label": v} for k, v in discrete_values.items()]
-    else:
-        entries = discrete_values
+    if meta.get("type", "") == "discrete" and discrete_values:
+        # Normalize to list of {value, label} dicts
+        if isinstance(discrete_values, dict):
+            entries = [{"value": k, "label": v} for k, v in discrete_values.items()]
+        else:
+            entries = discrete_values
 
-    # Case-insensitive label lookup
-    value_lower = value.lower()
-    for dv in entries:
-        label = str(dv.get("label", ""))
-        if label.lower() == value_lower:
-            raw_code = dv.get("value")
+        for dv in entries:
+            label = str(dv.get("label", ""))
+            code = dv.get("value")
             # Discrete codes may be stored as string-encoded ints
-            if isinstance(raw_code, str):
+            if isinstance(code, str):
                 try:
-                    return int(raw_code)
+                    code = int(code)
                 except ValueError:
-                    return raw_code
-            return raw_code
+                    pass
+            index.setdefault(label.lower(), (label, code))
+
+    await field_cache.set(cache_key, index)
+    return index
+
+
+def _lookup_discrete_label(
+    value: object,
+    field_id: str,
+    index: dict[str, tuple[str, object]],
+) -> object:
+    """Map a string label to its discrete code using a label index.
+
+    Args:
+        value: The filter value (may be string, int, etc.).
+        field_id: The field ID being filtered on (for error messages).
+        index: Label index from ``_get_field_label_index``.
+
+    Returns:
+        The resolved code, or the original value if not applicable.
+
+    Raises:
+        ValueError: If the string label is not found in discrete values.
+    """
+    if not isinstance(value, str) or not index:
+        return value
+
+    # Case-insensitive label lookup
+    match = index.get(value.lower())
+    if match is not None:
+        return match[1]
 
     # Not found - build helpful error
-    sample_labels = [str(dv.get("label", "?")) for dv in entries[:10]]
-    suffix = f" (and {len(entries) - 10} more)" if len(entries) > 10 else ""
+    sample_labels = [label for label, _ in list(index.values())[:10]]
+    suffix = f" (and {len(index) - 10} more)" if len(index) > 10 else ""
     raise ValueError(
         f"Discrete value '{value}' not found for field '{field_id}'. "
         f"Available values include: {', '.join(sample_labels)}{suffix}. "
@@ -311,6 +509,37 @@ async def _resolve_discrete_filter_value(
     )
 
 
+async def _resolve_discrete_filter_value(
+    value: object,
+    field_id: str,
+    ems_system_id: int,
+    database_id: str,
+) -> object:
+    """Resolve a string filter value to its numeric code for discrete fields.
+
+    If the value is not a string, it is returned as-is. If the field is not
+    discrete, the string is returned as-is. Otherwise, the field's discrete
+    value mappings are looked up and the label is matched case-insensitively.
+
+    Args:
+        value: The filter value (may be string, int, etc.).
+        field_id: The field ID being filtered on.
+        ems_system_id: The EMS system ID.
+        database_id: The database ID.
+
+    Returns:
+        The resolved numeric code, or the original value if not applicable.
+
+    Raises:
+        ValueError: If the string label is not found in discrete values.
+    """
+    if not isinstance(value, str):
+        return value
+
+    index = await _get_field_label_index(ems_system_id, database_id, field_id)
+    return _lookup_discrete_label(value, field_id, index)
+
+
 async def _resolve_filters(
     filters: list[QueryFilter],
     ems_system_id: int,
@@ -319,7 +548,8 @@ async def _resolve_filters(
     """Resolve string values in filters to numeric codes for discrete fields.
 
     Processes ``equal``, ``notEqual``, and ``in`` operators. Other operators
-    are passed through unchanged.
+    are passed through unchanged, as is the whole list when no filter has a
+    string value.
 
     Args:
         filters: The original filter list.
@@ -329,29 +559,51 @@ async def _resolve_filters(
     Returns:
         A new filter list with string values resolved where applicable.
     """
+    # Fetch label indexes for every field with string values concurrently,
+    # so the resolution pass below is plain dict lookups.
+    field_ids: dict[str, None] = {}
+    for f in filters:
+        op = f["operator"]
+        value = f.get("value")
+        if op in ("equal", "notEqual"):
+            has_label = isinstance(value, str)
+        elif op == "in" and isinstance(value, (list, tuple)):
+            has_label = any(isinstance(item, str) for item in value)
+        else:
+            has_label = False
+        if has_label:
+            field_ids[str(f["field_id"])] = None
+
+    # Common case: numeric/time filters only, nothing to resolve
+    if not field_ids:
+        return filters
+
+    indexes = dict(zip(
+        field_ids,
+        await asyncio.gather(
+            *(_get_field_label_index(ems_system_id, database_id, fid) for fid in field_ids)
+        ),
+        strict=True,
+    ))
+
     resolved: list[QueryFilter] = []
     for f in filters:
         op = f["operator"]
+        field_id = str(f["field_id"])
+        index = indexes.get(field_id, {})
         if op in ("equal", "notEqual"):
-            value = f.get("value")
-            new_value = await _resolve_discrete_filter_value(
-                value, f["field_id"], ems_system_id, database_id,
-            )
+            new_value = _lookup_discrete_label(f.get("value"), field_id, index)
             new_filter: QueryFilter = {"field_id": f["field_id"], "operator": op}
             new_filter["value"] = new_value
             resolved.append(new_filter)
         elif op == "in":
             value = f.get("value")
             if isinstance(value, (list, tuple)):
-                new_list = []
-                for item in value:
-                    new_list.append(
-                        await _resolve_discrete_filter_value(
-                            item, f["field_id"], ems_system_id, database_id,
-                        )
-                    )
                 new_filter = {"field_id": f["field_id"], "operator": op}
-                new_filter["value"] = new_list
+                new_filter["value"] = [
+                    _lookup_discrete_label(item, field_id, index)
+                    for item in value
+                ]
                 resolved.append(new_filter)
             else:
                 resolved.append(f)
@@ -360,9 +612,55 @@ async def _resolve_filters(
     return resolved
 
 
+def _freeze_filter_value(value: object) -> tuple[Any, ...]:
+    """Turn a filter value into a hashable cache key component.
+
+    Scalars are tagged with their type so that e.g. ``1``, ``1.0`` and
+    ``True`` (which compare equal) do not share a cache entry.
+
+    Args:
+        value: The filter value.
+
+    Returns:
+        A hashable representation of the value.
+
+    Raises:
+        TypeError: If the value contains something unhashable.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_freeze_filter_value, value))
+    hash(value)
+    return (type(value), value)
+
+
+def _thaw_filter_value(frozen: tuple[Any, ...]) -> object:
+    """Invert ``_freeze_filter_value``, turning sequences back into lists.
+
+    Args:
+        frozen: A value produced by ``_freeze_filter_value``.
+
+    Returns:
+        The original filter value.
+    """
+    if len(frozen) == 2 and isinstance(frozen[0], type):
+        return frozen[1]
+    return [_thaw_filter_value(item) for item in frozen]
+
+
+@lru_cache(maxsize=1024)
+def _build_frozen_filter(
+    operator: str, field_id: str | int, frozen: tuple[Any, ...]
+) -> dict[str, Any]:
+    """Memoized ``_translate_filter`` keyed on a frozen filter value."""
+    return _translate_filter(operator, field_id, _thaw_filter_value(frozen))
+
+
 def _build_single_filter(f: QueryFilter) -> dict[str, Any]:
     """Translate a flat QueryFilter into the nested EMS API filter structure.
 
+    Results are memoized, since agents often re-issue the same filters with
+    only the limit or fields changed. Each call gets its own copy.
+
     Args:
         f: A flat filter specification.
 
@@ -372,42 +670,80 @@ def _build_single_filter(f: QueryFilter) -> dict[str, Any]:
     Raises:
         ValueError: If the filter specification is invalid.
     """
-    operator = f["operator"]
-    field_id = f["field_id"]
-    field_arg: dict[str, Any] = {"type": "field", "value": field_id}
+    try:
+        frozen = _freeze_filter_value(f.get("value"))
+    except TypeError:
+        return _translate_filter(f["operator"], f["field_id"], f.get("value"))
 
-    if operator in UNARY_OPERATORS:
-        return {"operator": operator, "args": [field_arg]}
-
-    value = f.get("value")
-
-    if operator == "between":
-        if not isinstance(value, (list, tuple)) or len(value) != 2:
-            raise ValueError(f"'between' filter requires a list of [min, max], got: {value!r}")
-        return {
-            "operator": "betweenInclusive",
-            "args": [
-                field_arg,
-                {"type": "constant", "value": value[0]},
-                {"type": "constant", "value": value[1]},
-            ],
-        }
+    built = _build_frozen_filter(f["operator"], f["field_id"], frozen)
+    # Arguments only hold scalars, so copying one level down is enough
+    return {**built, "args": [dict(arg) for arg in built["args"]]}
 
-    if operator == "in":
-        if not isinstance(value, (list, tuple)) or len(value) == 0:
-            raise ValueError(f"'in' filter requires a non-empty list, got: {value!r}")
-        args: list[dict[str, Any]] = [field_arg]
-        for v in value:
-            args.append({"type": "constant", "value": v})
-        return {"operator": "in", "args": args}
 
-    # Standard binary operators: equal, notEqual, greaterThan, etc.
+def _translate_unary(operator: str, field_arg: dict[str, Any], value: object) -> dict[str, Any]:
+    """Build a filter for an operator that takes no value (isNull, isNotNull)."""
+    return {"operator": operator, "args": [field_arg]}
+
+
+def _translate_between(operator: str, field_arg: dict[str, Any], value: object) -> dict[str, Any]:
+    """Build an inclusive range filter from a [min, max] value."""
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise ValueError(f"'between' filter requires a list of [min, max], got: {value!r}")
+    return {
+        "operator": "betweenInclusive",
+        "args": [
+            field_arg,
+            {"type": "constant", "value": value[0]},
+            {"type": "constant", "value": value[1]},
+        ],
+    }
+
+
+def _translate_in(operator: str, field_arg: dict[str, Any], value: object) -> dict[str, Any]:
+    """Build a set-membership filter from a non-empty list value."""
+    if not isinstance(value, (list, tuple)) or len(value) == 0:
+        raise ValueError(f"'in' filter requires a non-empty list, got: {value!r}")
+    args = [field_arg, *[{"type": "constant", "value": v} for v in value]]
+    return {"operator": "in", "args": args}
+
+
+def _translate_binary(operator: str, field_arg: dict[str, Any], value: object) -> dict[str, Any]:
+    """Build a standard binary filter: equal, notEqual, greaterThan, etc."""
     return {
         "operator": operator,
         "args": [field_arg, {"type": "constant", "value": value}],
     }
 
 
+# Filter builders by operator; anything not listed is a plain binary operator
+_FILTER_TRANSLATORS: dict[
+    str, Callable[[str, dict[str, Any], object], dict[str, Any]]
+] = {
+    **dict.fromkeys(UNARY_OPERATORS, _translate_unary),
+    "between": _translate_between,
+    "in": _translate_in,
+}
+
+
+def _translate_filter(operator: str, field_id: str | int, value: object) -> dict[str, Any]:
+    """Build the nested EMS API filter structure for a flat QueryFilter.
+
+    Args:
+        operator: The filter operator.
+        field_id: The field ID being filtered on.
+        value: The filter value.
+
+    Returns:
+        Nested EMS API filter dict.
+
+    Raises:
+        ValueError: If the filter specification is invalid.
+    """
+    field_arg: dict[str, Any] = {"type": "field", "value": field_id}
+    translate = _FILTER_TRANSLATORS.get(operator, _translate_binary)
+    return translate(operator, field_arg, value)
+
+
 def _build_query_body(
     fields: list[QueryField],
     filters: list[QueryFilter] | None,
@@ -430,20 +766,25 @@ def _build_query_body(
     # Build select array with emspy-compatible structure:
     # - Every select entry gets "aggregate" (defaults to "none")
     # - Non-aggregated fields go into a top-level "groupBy" array
-    has_aggregate = any(f.get("aggregate") for f in fields)
     select: list[dict[str, Any]] = []
-    group_by: list[dict[str, str]] = []
+    non_aggregated: list[dict[str, str]] = []
+    has_aggregate = False
     for f in fields:
+        aggregate = f.get("aggregate")
         entry: dict[str, Any] = {
             "fieldId": f["field_id"],
-            "aggregate": f.get("aggregate") or "none",
+            "aggregate": aggregate or "none",
         }
-        if "alias" in f and f["alias"]:
+        if f.get("alias"):
             entry["alias"] = f["alias"]
         select.append(entry)
-        # Non-aggregated fields become groupBy entries
-        if has_aggregate and not f.get("aggregate"):
-            group_by.append({"fieldId": f["field_id"]})
+        if aggregate:
+            has_aggregate = True
+        else:
+            non_aggregated.append({"fieldId": f["field_id"]})
+
+    # Non-aggregated fields become groupBy entries when anything is aggregated
+    group_by = non_aggregated if has_aggregate else []
 
     # Map format to API value
     api_format = "none" if fmt == "raw" else "display"
@@ -517,6 +858,22 @@ def _build_analytics_body(
     return body
 
 
+def _table_cell(cell: Any) -> str:
+    """Render a query result cell for the text table.
+
+    Args:
+        cell: The raw cell value.
+
+    Returns:
+        ``NULL`` for missing values, otherwise the value as text truncated
+        to 40 characters.
+    """
+    if cell is None:
+        return "NULL"
+    s = str(cell)
+    return s if len(s) <= 40 else s[:37] + "..."
+
+
 def _format_query_results(
     response: dict[str, Any],
     fields: list[QueryField],
@@ -538,51 +895,112 @@ def _format_query_results(
 
     col_names = _extract_column_names(headers_raw, fields)
 
-    # Convert cell values to strings, handling None/NULL
-    str_rows: list[list[str]] = []
+    # Column widths (capped at 40) from a first pass that measures cells
+    # without keeping their text, so large results never hold a grid of
+    # cell strings in memory.
+    col_widths: list[int] = [min(len(name), 40) for name in col_names]
+    num_cols = len(col_widths)
     for row in rows:
-        str_row: list[str] = []
-        for cell in row:
-            if cell is None:
-                str_row.append("NULL")
-            else:
-                s = str(cell)
-                if len(s) > 40:
-                    s = s[:37] + "..."
-                str_row.append(s)
-        str_rows.append(str_row)
+        col_widths[: len(row)] = map(
+            max, col_widths, map(len, map(_table_cell, row[:num_cols]))
+        )
+
+    # Row template: left-justified cells padded to their column widths.
+    # Short rows are padded with empty cells.
+    row_template = " | ".join(f"%-{w}s" for w in col_widths)
+    padding = ("",) * num_cols
+
+    output = io.StringIO()
+    output.write(row_template % tuple(col_names))
+    output.write("\n")
+    output.write("-+-".join("-" * w for w in col_widths))
+    for row in rows:
+        output.write("\n")
+        output.write(
+            row_template % (*map(_table_cell, row[:num_cols]), *padding[len(row):])
+        )
+    output.write(f"\n\n({len(rows)} row(s) returned)")
+
+    return output.getvalue()
+
+
+def _analytics_column_names(
+    analytic_results: list[dict[str, Any]],
+    analytic_names: list[str] | None,
+) -> list[str]:
+    """Build the column names for one flight's analytics results.
+
+    Display names are used for the leading columns; any results beyond them
+    fall back to a formatted version of the analytic ID.
+
+    Args:
+        analytic_results: The ``results`` list from the API response.
+        analytic_names: Optional display names, in result order.
 
-    # Calculate column widths (cap at 40)
-    col_widths: list[int] = []
-    for i, name in enumerate(col_names):
-        max_w = min(len(name), 40)
-        for row in str_rows:
-            if i < len(row):
-                max_w = max(max_w, min(len(row[i]), 40))
-        col_widths.append(max_w)
+    Returns:
+        Column names, starting with ``"Offset"``.
+    """
+    named = min(len(analytic_names), len(analytic_results)) if analytic_names else 0
+    col_names = ["Offset"]
+    col_names += analytic_names[:named] if analytic_names else ()
+    col_names.extend(
+        _format_analytic_header(str(ar.get("analyticId", f"Analytic_{i}")))
+        for i, ar in enumerate(analytic_results[named:], start=named)
+    )
+    return col_names
+
+
+def _analytics_columns(
+    offsets: list[Any],
+    analytic_results: list[dict[str, Any]],
+    count: int,
+    fill: Any = None,
+) -> list[list[Any]]:
+    """Cut a flight's column-oriented analytics data down to ``count`` rows.
 
-    # Build table
-    lines: list[str] = []
+    Returns the offsets column followed by one column per analytic, each
+    sliced to ``count`` entries and padded with ``fill`` where an analytic
+    returned fewer values. ``zip(*columns)`` then yields the display rows.
+
+    Args:
+        offsets: Offsets returned by the API.
+        analytic_results: Per-analytic result dicts with ``values`` lists.
+        count: Number of rows to keep.
+        fill: Value used for missing analytic values.
+
+    Returns:
+        List of columns, offsets first.
+    """
+    columns: list[list[Any]] = [offsets[:count]]
+    for ar in analytic_results:
+        # The slice is already a fresh list, so pad it in place
+        values = ar.get("values", [])[:count]
+        if len(values) < count:
+            values.extend(repeat(fill, count - len(values)))
+        columns.append(values)
+    return columns
 
-    # Header
-    header_line = " | ".join(name.ljust(col_widths[i]) for i, name in enumerate(col_names))
-    lines.append(header_line)
 
-    # Separator
-    sep_line = "-+-".join("-" * w for w in col_widths)
-    lines.append(sep_line)
+def _looks_all_zero(total_rows: int, analytic_results: list[dict[str, Any]]) -> bool:
+    """Check for suspicious all-zero analytics data (possible invalid flight ID).
 
-    # Data rows
-    for row in str_rows:
-        cells: list[str] = []
-        for i, w in enumerate(col_widths):
-            val = row[i] if i < len(row) else ""
-            cells.append(val.ljust(w))
-        lines.append(" | ".join(cells))
+    Only flights with at least 100 rows are checked. The scan stops at the
+    first non-zero value, which for real data is almost always the first one.
 
-    lines.append(f"\n({len(rows)} row(s) returned)")
+    Args:
+        total_rows: Number of offsets returned for the flight.
+        analytic_results: Per-analytic result dicts with ``values`` lists.
 
-    return "\n".join(lines)
+    Returns:
+        True if every analytic value is 0.0 or missing.
+    """
+    if total_rows < 100 or not analytic_results:
+        return False
+    return not any(
+        v != 0.0 and v is not None
+        for ar in analytic_results
+        for v in ar.get("values", [])
+    )
 
 
 def _format_analytics_results(
@@ -607,17 +1025,18 @@ def _format_analytics_results(
     if not results:
         return "No analytics results."
 
-    sections: list[str] = []
+    output = io.StringIO()
     error_count = 0
 
-    for r in results:
+    for n, r in enumerate(results):
         flight_id = r.get("flight_id", "?")
-        section_lines: list[str] = [f"=== Flight {flight_id} ==="]
+        if n:
+            output.write("\n\n")
+        output.write(f"=== Flight {flight_id} ===")
 
         if "error" in r:
-            section_lines.append(f"Error: {r['error']}")
+            output.write(f"\nError: {r['error']}")
             error_count += 1
-            sections.append("\n".join(section_lines))
             continue
 
         data = r.get("data", {})
@@ -625,95 +1044,56 @@ def _format_analytics_results(
         analytic_results = data.get("results", [])
 
         if not offsets:
-            section_lines.append("No data returned.")
-            sections.append("\n".join(section_lines))
+            output.write("\nNo data returned.")
             continue
 
         # Column names: Offset + display names (or formatted IDs as fallback)
-        col_names = ["Offset"]
-        for i, ar in enumerate(analytic_results):
-            if analytic_names and i < len(analytic_names):
-                col_names.append(analytic_names[i])
-            else:
-                raw_id = str(ar.get("analyticId", f"Analytic_{i}"))
-                col_names.append(_format_analytic_header(raw_id))
-
-        # Build rows: each row is [offset, value1, value2, ...]
-        data_rows: list[list[Any]] = []
-        for i, offset in enumerate(offsets):
-            row: list[Any] = [offset]
-            for ar in analytic_results:
-                values = ar.get("values", [])
-                row.append(values[i] if i < len(values) else None)
-            data_rows.append(row)
+        col_names = _analytics_column_names(analytic_results, analytic_names)
 
         # Check for suspicious all-zero data (possible invalid flight ID)
-        total_rows = len(data_rows)
-        if total_rows >= 100 and analytic_results:
-            all_zero = True
-            for ar in analytic_results:
-                values = ar.get("values", [])
-                if any(v != 0.0 and v is not None for v in values):
-                    all_zero = False
-                    break
-            if all_zero:
-                section_lines.append(
-                    "WARNING: All analytic values are 0.0. This may indicate "
-                    "an invalid flight ID. Verify the flight ID using query_database."
-                )
+        total_rows = len(offsets)
+        if _looks_all_zero(total_rows, analytic_results):
+            output.write(
+                "\nWARNING: All analytic values are 0.0. This may indicate "
+                "an invalid flight ID. Verify the flight ID using query_database."
+            )
 
-        # Convert to string rows
-        display_rows = data_rows[:max_rows_per_flight]
-        str_rows: list[list[str]] = []
-        for row in display_rows:
-            str_row: list[str] = []
-            for cell in row:
-                if cell is None:
-                    str_row.append("NULL")
-                else:
-                    str_row.append(str(cell))
-            str_rows.append(str_row)
-
-        # Calculate column widths
-        col_widths: list[int] = [len(n) for n in col_names]
-        for row in str_rows:
-            for i, cell in enumerate(row):
-                if i < len(col_widths):
-                    col_widths[i] = max(col_widths[i], len(cell))
-
-        # Cap widths at 40
-        col_widths = [min(w, 40) for w in col_widths]
+        # Stringify only the displayed rows, one column at a time
+        display_count = min(total_rows, max_rows_per_flight)
+        str_cols = [
+            ["NULL" if cell is None else str(cell) for cell in col]
+            for col in _analytics_columns(offsets, analytic_results, display_count)
+        ]
 
-        # Header
-        header_line = " | ".join(col_names[i].rjust(col_widths[i]) for i in range(len(col_names)))
-        section_lines.append(header_line)
+        # Calculate column widths, capped at 40
+        col_widths = [
+            min(max(len(name), max(map(len, col))), 40)
+            for name, col in zip(col_names, str_cols, strict=True)
+        ]
 
-        sep_line = "-+-".join("-" * w for w in col_widths)
-        section_lines.append(sep_line)
+        # Row template: right-aligned cells (numeric data)
+        row_template = "\n" + " | ".join(f"%{w}s" for w in col_widths)
 
-        # Data rows (right-aligned for numeric data)
-        for row in str_rows:
-            cells: list[str] = []
-            for i, w in enumerate(col_widths):
-                val = row[i] if i < len(row) else ""
-                cells.append(val.rjust(w))
-            section_lines.append(" | ".join(cells))
+        # Header
+        output.write(row_template % tuple(col_names))
+        output.write("\n")
+        output.write("-+-".join("-" * w for w in col_widths))
+
+        # Data rows
+        for row in zip(*str_cols, strict=True):
+            output.write(row_template % row)
 
         if total_rows > max_rows_per_flight:
-            section_lines.append(
-                f"... ({total_rows - max_rows_per_flight} more rows, " f"{total_rows} total)"
+            output.write(
+                f"\n... ({total_rows - max_rows_per_flight} more rows, {total_rows} total)"
             )
         else:
-            section_lines.append(f"({total_rows} row(s))")
-
-        sections.append("\n".join(section_lines))
-
-    output = "\n\n".join(sections)
+            output.write(f"\n({total_rows} row(s))")
 
     if error_count > 0:
-        output += f"\n\n({error_count} flight(s) had errors)"
+        output.write(f"\n\n({error_count} flight(s) had errors)")
 
-    return output
+    return output.getvalue()
 
 
 def _extract_column_names(
@@ -729,15 +1109,13 @@ def _extract_column_names(
     Returns:
         List of column name strings.
     """
-    col_names: list[str] = []
-    for i, h in enumerate(headers_raw):
-        if i < len(fields) and "alias" in fields[i] and fields[i]["alias"]:
-            col_names.append(fields[i]["alias"])
-        else:
-            col_names.append(
-                h.get("name", f"Column {i}") if isinstance(h, dict) else str(h)
-            )
-    return col_names
+    # Aliases by column position, padded so every header has an entry
+    aliases = [f.get("alias") for f in fields[: len(headers_raw)]]
+    aliases += [None] * (len(headers_raw) - len(aliases))
+    return [
+        alias or (h.get("name", f"Column {i}") if isinstance(h, dict) else str(h))
+        for i, (h, alias) in enumerate(zip(headers_raw, aliases, strict=True))
+    ]
 
 
 def _format_query_results_csv(
@@ -764,8 +1142,8 @@ def _format_query_results_csv(
     output = io.StringIO()
     writer = csv.writer(output, quoting=csv.QUOTE_MINIMAL)
     writer.writerow(col_names)
-    for row in rows:
-        writer.writerow(["" if cell is None else cell for cell in row])
+    # csv.writer already renders None as an empty field.
+    writer.writerows(rows)
 
     output.write(f"\n({len(rows)} row(s) returned)")
     return output.getvalue()
@@ -792,19 +1170,14 @@ def _format_query_results_json(
 
     col_names = _extract_column_names(headers_raw, fields)
 
-    row_dicts = []
-    for row in rows:
-        row_dict: dict[str, Any] = {}
-        for i, col in enumerate(col_names):
-            row_dict[col] = row[i] if i < len(row) else None
-        row_dicts.append(row_dict)
-
-    result = {
-        "columns": col_names,
-        "rows": row_dicts,
-        "row_count": len(rows),
-    }
-    return json.dumps(result, separators=(",", ":"))
+    # Short rows are padded with null
+    rows_json = _json_encode_array(
+        dict(zip(col_names, chain(row, repeat(None)), strict=False)) for row in rows
+    )
+    return (
+        f'{{"columns":{_json_encode(col_names)},"rows":{rows_json},'
+        f'"row_count":{len(rows)}}}'
+    )
 
 
 def _format_analytics_results_csv(
@@ -845,37 +1218,29 @@ def _format_analytics_results_csv(
             continue
 
         # Column headers
-        col_names = ["Offset"]
-        for i, ar in enumerate(analytic_results):
-            if analytic_names and i < len(analytic_names):
-                col_names.append(analytic_names[i])
-            else:
-                raw_id = str(ar.get("analyticId", f"Analytic_{i}"))
-                col_names.append(_format_analytic_header(raw_id))
+        col_names = _analytics_column_names(analytic_results, analytic_names)
 
         writer.writerow(col_names)
 
         # All-zero warning
         total_rows = len(offsets)
-        if total_rows >= 100 and analytic_results:
-            all_zero = all(
-                all(v == 0.0 or v is None for v in ar.get("values", []))
-                for ar in analytic_results
+        if _looks_all_zero(total_rows, analytic_results):
+            output.write(
+                "# WARNING: All analytic values are 0.0. "
+                "This may indicate an invalid flight ID.\n"
             )
-            if all_zero:
-                output.write(
-                    "# WARNING: All analytic values are 0.0. "
-                    "This may indicate an invalid flight ID.\n"
-                )
 
-        # Data rows
+        # Data rows. Time series are usually all numbers, which never need
+        # quoting, so join them directly and keep csv.writer for other data.
         display_count = min(total_rows, max_rows_per_flight)
-        for i in range(display_count):
-            row: list[Any] = [offsets[i]]
-            for ar in analytic_results:
-                values = ar.get("values", [])
-                row.append(values[i] if i < len(values) else "")
-            writer.writerow(row)
+        columns = _analytics_columns(offsets, analytic_results, display_count)
+        if all(v is None or type(v) in (int, float) for col in columns for v in col):
+            str_cols = [["" if v is None else str(v) for v in col] for col in columns]
+            if display_count:
+                output.write("\r\n".join(map(",".join, zip(*str_cols, strict=True))))
+                output.write("\r\n")
+        else:
+            writer.writerows(zip(*columns, strict=True))
 
         if total_rows > max_rows_per_flight:
             output.write(
@@ -888,12 +1253,12 @@ def _format_analytics_results_csv(
     return output.getvalue()
 
 
-def _format_analytics_results_json(
+def _analytics_flight_entries(
     results: list[dict[str, Any]],
-    max_rows_per_flight: int = 200,
-    analytic_names: list[str] | None = None,
-) -> str:
-    """Format analytics results as compact JSON.
+    max_rows_per_flight: int,
+    analytic_names: list[str] | None,
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Build the column-oriented per-flight entries for structured output.
 
     Args:
         results: List of per-flight result dicts.
@@ -901,11 +1266,10 @@ def _format_analytics_results_json(
         analytic_names: Optional display names for analytics columns.
 
     Returns:
-        JSON-formatted string with flights and warnings.
+        Tuple of (flight entries, warnings). Each successful entry has
+        ``columns``, ``data`` (one value list per column) and ``row_count``;
+        failed flights carry ``error`` instead.
     """
-    if not results:
-        return '{"flights":[],"warnings":[]}'
-
     flights_out: list[dict[str, Any]] = []
     warnings: list[str] = []
 
@@ -926,52 +1290,151 @@ def _format_analytics_results_json(
         if not offsets:
             flights_out.append({
                 "flight_id": flight_id,
-                "rows": [],
+                "columns": [],
+                "data": [],
                 "row_count": 0,
             })
             continue
 
         # Column names
-        col_names = []
-        for i, ar in enumerate(analytic_results):
-            if analytic_names and i < len(analytic_names):
-                col_names.append(analytic_names[i])
-            else:
-                raw_id = str(ar.get("analyticId", f"Analytic_{i}"))
-                col_names.append(_format_analytic_header(raw_id))
+        col_names = _analytics_column_names(analytic_results, analytic_names)
 
         # All-zero warning
         total_rows = len(offsets)
-        if total_rows >= 100 and analytic_results:
-            all_zero = all(
-                all(v == 0.0 or v is None for v in ar.get("values", []))
-                for ar in analytic_results
+        if _looks_all_zero(total_rows, analytic_results):
+            warnings.append(
+                f"Flight {flight_id}: All analytic values are 0.0. "
+                "This may indicate an invalid flight ID."
             )
-            if all_zero:
-                warnings.append(
-                    f"Flight {flight_id}: All analytic values are 0.0. "
-                    "This may indicate an invalid flight ID."
-                )
 
-        # Build rows
         display_count = min(total_rows, max_rows_per_flight)
-        row_dicts = []
-        for i in range(display_count):
-            row_dict: dict[str, Any] = {"Offset": offsets[i]}
-            for j, ar in enumerate(analytic_results):
-                values = ar.get("values", [])
-                col = col_names[j] if j < len(col_names) else f"Analytic_{j}"
-                row_dict[col] = values[i] if i < len(values) else None
-            row_dicts.append(row_dict)
-
         flights_out.append({
             "flight_id": flight_id,
-            "rows": row_dicts,
+            "columns": col_names,
+            "data": _analytics_columns(offsets, analytic_results, display_count),
             "row_count": total_rows,
         })
 
-    result = {"flights": flights_out, "warnings": warnings}
-    return json.dumps(result, separators=(",", ":"))
+    return flights_out, warnings
+
+
+def _format_analytics_results_json(
+    results: list[dict[str, Any]],
+    max_rows_per_flight: int = 200,
+    analytic_names: list[str] | None = None,
+) -> str:
+    """Format analytics results as compact, column-oriented JSON.
+
+    Each flight carries its column names and one value list per column
+    (offsets first), rather than a dict per row, so column names are not
+    repeated on every row.
+
+    Args:
+        results: List of per-flight result dicts.
+        max_rows_per_flight: Maximum display rows per flight.
+        analytic_names: Optional display names for analytics columns.
+
+    Returns:
+        JSON-formatted string with flights, plus warnings when any were raised.
+    """
+    if not results:
+        return '{"flights":[]}'
+
+    flights_out, warnings = _analytics_flight_entries(
+        results, max_rows_per_flight, analytic_names
+    )
+    output: dict[str, Any] = {"flights": flights_out}
+    if warnings:
+        output["warnings"] = warnings
+    return _json_encode(output)
+
+
+def _arrow_column(values: list[Any]) -> Any:
+    """Convert one column of values to an Arrow array.
+
+    Numeric columns keep their inferred type. Columns Arrow cannot infer a
+    single type for are stored as dictionary-encoded strings.
+
+    Args:
+        values: The column values.
+
+    Returns:
+        A ``pyarrow.Array``.
+    """
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(
+            [None if v is None else str(v) for v in values]
+        ).dictionary_encode()
+
+
+def _arrow_ipc_base64(columns: list[str], data: list[list[Any]]) -> str:
+    """Serialize columns as a base64-encoded Arrow IPC stream.
+
+    Args:
+        columns: Column names.
+        data: One value list per column.
+
+    Returns:
+        The base64 text of the IPC stream.
+    """
+    table = pa.Table.from_arrays([_arrow_column(col) for col in data], names=columns)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue()).decode("ascii")
+
+
+def _format_analytics_results_arrow(
+    results: list[dict[str, Any]],
+    max_rows_per_flight: int = 200,
+    analytic_names: list[str] | None = None,
+) -> str:
+    """Format analytics results as Arrow IPC streams in a JSON envelope.
+
+    Same layout as the JSON format, except each flight's ``columns`` and
+    ``data`` are replaced by ``arrow``: a base64-encoded Arrow IPC stream
+    holding that flight's table. Requires pyarrow.
+
+    Args:
+        results: List of per-flight result dicts.
+        max_rows_per_flight: Maximum display rows per flight.
+        analytic_names: Optional display names for analytics columns.
+
+    Returns:
+        JSON-formatted string with flights, plus warnings when any were raised.
+    """
+    flights_out, warnings = _analytics_flight_entries(
+        results, max_rows_per_flight, analytic_names
+    )
+    for flight in flights_out:
+        if "columns" in flight:
+            flight["arrow"] = _arrow_ipc_base64(flight.pop("columns"), flight.pop("data"))
+    output: dict[str, Any] = {"flights": flights_out}
+    if warnings:
+        output["warnings"] = warnings
+    return _json_encode(output)
+
+
+async def _report_slow_progress(
+    ctx: Context | None,
+    started: float,
+    progress: int,
+    total: int,
+    message: str,
+) -> None:
+    """Report progress only if the call has been running for a while.
+
+    Args:
+        ctx: Optional MCP context.
+        started: ``time.monotonic()`` value taken when the call began.
+        progress: Current step.
+        total: Total number of steps.
+        message: Progress message.
+    """
+    if ctx and time.monotonic() - started >= _PROGRESS_MIN_ELAPSED:
+        await ctx.report_progress(progress, total, message)
 
 
 @mcp.tool
@@ -998,7 +1461,7 @@ async def query_database(
     Args:
         ems_system_id: EMS system ID.
         database_id: Database ID or name (e.g. "FDW Flights").
-        fields: Fields to retrieve. Each has field_id (name, [N] ref, or
+        fields: Fields to retrieve (max 100). Each has field_id (name, [N] ref, or
             bracket ID), optional alias, optional aggregate.
         filters: Filter conditions (AND-combined). Each has field_id, operator
             (equal/notEqual/greaterThan/lessThan/between/in/like/isNull/etc.), value.
@@ -1010,10 +1473,15 @@ async def query_database(
     Returns:
         Results in the requested output format.
     """
+    started = time.monotonic()
+
     # Validate inputs
     if not fields:
         return "Error: At least one field is required. Use find_fields to discover field IDs."
 
+    if len(fields) > 100:
+        return "Error: Maximum 100 fields per query."
+
     if limit < 1 or limit > 10000:
         return "Error: limit must be between 1 and 10000."
 
@@ -1029,7 +1497,7 @@ async def query_database(
         if agg and agg not in VALID_AGGREGATES:
             return (
                 f"Error: Invalid aggregate '{agg}'. "
-                f"Valid aggregates: {', '.join(sorted(VALID_AGGREGATES))}"
+                f"Valid aggregates: {_VALID_AGGREGATES_TEXT}"
             )
 
     # Validate filter operators
@@ -1038,7 +1506,7 @@ async def query_database(
             if f["operator"] not in VALID_OPERATORS:
                 return (
                     f"Error: Invalid filter operator '{f['operator']}'. "
-                    f"Valid operators: {', '.join(sorted(VALID_OPERATORS))}"
+                    f"Valid operators: {_VALID_OPERATORS_TEXT}"
                 )
 
     # Resolve database name -> ID
@@ -1047,56 +1515,42 @@ async def query_database(
     except ValueError as e:
         return f"Error resolving database: {e}"
 
-    # Resolve field references -> opaque IDs
-    try:
-        resolved_fields: list[QueryField] = []
-        for f in fields:
-            resolved_id = await _resolve_field_id(
-                f["field_id"], ems_system_id, database_id
-            )
-            resolved_fields.append({**f, "field_id": resolved_id})
-        fields = resolved_fields
-    except (ValueError, EMSAPIError) as e:
-        return f"Error resolving field: {e}"
-
-    # Resolve field references in filters
+    # Resolve field references in fields, filters, and order_by -> opaque IDs,
+    # all in one concurrent batch
+    ref_groups: list[tuple[str, list[Any]]] = [
+        ("field", fields),
+        ("filter field", filters or []),
+        ("order_by field", order_by or []),
+    ]
+    resolved_ids = await _resolve_field_refs(
+        (item["field_id"] for _, items in ref_groups for item in items),
+        ems_system_id,
+        database_id,
+    )
+    field_ids: dict[str | int, str] = {}
+    for label, items in ref_groups:
+        for item in items:
+            resolved_id = resolved_ids[item["field_id"]]
+            if not isinstance(resolved_id, str):
+                return f"Error resolving {label}: {resolved_id}"
+            field_ids[item["field_id"]] = resolved_id
+
+    fields = _with_resolved_ids(fields, field_ids)
     if filters:
-        try:
-            resolved_filters: list[QueryFilter] = []
-            for f in filters:
-                resolved_id = await _resolve_field_id(
-                    f["field_id"], ems_system_id, database_id
-                )
-                resolved_filters.append({**f, "field_id": resolved_id})
-            filters = resolved_filters
-        except (ValueError, EMSAPIError) as e:
-            return f"Error resolving filter field: {e}"
-
-    # Resolve field references in order_by
+        filters = _with_resolved_ids(filters, field_ids)
     if order_by:
-        try:
-            resolved_order: list[QueryOrderBy] = []
-            for ob in order_by:
-                resolved_id = await _resolve_field_id(
-                    ob["field_id"], ems_system_id, database_id
-                )
-                resolved_order.append({**ob, "field_id": resolved_id})
-            order_by = resolved_order
-        except (ValueError, EMSAPIError) as e:
-            return f"Error resolving order_by field: {e}"
+        order_by = _with_resolved_ids(order_by, field_ids)
 
     # Resolve discrete filter values (string labels -> numeric codes)
     if filters:
-        if ctx:
-            await ctx.report_progress(1, 3, "Resolving filter values...")
+        await _report_slow_progress(ctx, started, 1, 3, "Resolving filter values...")
         try:
             filters = await _resolve_filters(filters, ems_system_id, database_id)
         except ValueError as e:
             return f"Error resolving filter value: {e}"
 
     # Build query body
-    if ctx:
-        await ctx.report_progress(2, 3, "Executing query...")
+    await _report_slow_progress(ctx, started, 2, 3, "Executing query...")
     try:
         body = _build_query_body(fields, filters, order_by, limit, format)
     except ValueError as e:
@@ -1113,9 +1567,10 @@ async def query_database(
                 logger_name="ems_mcp.query",
             )
         response = await client.post(path, json=body)
-        if ctx:
-            row_count = len(response.get("rows", []))
-            await ctx.report_progress(3, 3, f"Formatting {row_count} rows...")
+        row_count = len(response.get("rows", []))
+        await _report_slow_progress(
+            ctx, started, 3, 3, f"Formatting {row_count} rows..."
+        )
 
         if output_format == "csv":
             return _format_query_results_csv(response, fields)
@@ -1163,7 +1618,11 @@ async def query_flight_analytics(
         start_offset: Start time in seconds from flight start.
         end_offset: End time in seconds from flight start.
         sample_rate: Samples per second (default: 1.0).
-        output_format: 'table' (default), 'csv' (compact), or 'json' (structured).
+        output_format: 'table' (default), 'csv' (compact), 'json'
+            (structured; per flight, "columns" names and "data" holds one
+            value list per column; "warnings" appears only when non-empty),
+            or 'arrow' (as 'json', but each flight's table is a base64
+            Arrow IPC stream in "arrow"; requires pyarrow).
 
     Returns:
         Per-flight time-series data in the requested output format.
@@ -1187,8 +1646,14 @@ async def query_flight_analytics(
     if sample_rate <= 0:
         return "Error: sample_rate must be greater than 0."
 
-    if output_format not in ("table", "csv", "json"):
-        return "Error: output_format must be 'table', 'csv', or 'json'."
+    if output_format not in ("table", "csv", "json", "arrow"):
+        return "Error: output_format must be 'table', 'csv', 'json', or 'arrow'."
+
+    if output_format == "arrow" and pa is None:
+        return (
+            "Error: output_format='arrow' requires pyarrow. "
+            "Install it with: pip install 'ems-mcp[arrow]'"
+        )
 
     if start_offset is not None and end_offset is not None and start_offset >= end_offset:
         return "Error: start_offset must be less than end_offset."
@@ -1211,32 +1676,36 @@ async def query_flight_analytics(
     body = _build_analytics_body(analytic_ids, start_offset, end_offset, sample_rate)
     client = get_client()
 
-    results: list[dict[str, Any]] = []
+    # Flights are queried concurrently, a few at a time
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FLIGHT_QUERIES)
+    completed = 0
 
-    for i, fid in enumerate(flight_ids):
-        if ctx:
-            await ctx.report_progress(
-                i + 1, total_steps,
-                f"Querying flight {fid} ({i + 1}/{len(flight_ids)})...",
-            )
+    async def fetch_flight(fid: int) -> dict[str, Any]:
+        nonlocal completed
         path = f"/api/v2/ems-systems/{ems_system_id}/flights/{fid}/analytics/query"
-        try:
-            data = await client.post(path, json=body)
-            results.append({"flight_id": fid, "data": data})
-        except EMSNotFoundError:
-            results.append(
-                {
+        async with semaphore:
+            try:
+                data = await client.post(path, json=body)
+                result: dict[str, Any] = {"flight_id": fid, "data": data}
+            except EMSNotFoundError:
+                result = {
                     "flight_id": fid,
                     "error": f"Flight {fid} not found in EMS system {ems_system_id}.",
                 }
-            )
-        except EMSAPIError as e:
-            results.append(
-                {
+            except EMSAPIError as e:
+                result = {
                     "flight_id": fid,
                     "error": f"API error: {e.message}",
                 }
+        completed += 1
+        if ctx:
+            await ctx.report_progress(
+                completed, total_steps,
+                f"Queried flight {fid} ({completed}/{len(flight_ids)})...",
             )
+        return result
+
+    results = list(await asyncio.gather(*(fetch_flight(fid) for fid in flight_ids)))
 
     if ctx:
         await ctx.report_progress(total_steps, total_steps, "Formatting results...")
@@ -1246,6 +1715,8 @@ async def query_flight_analytics(
         formatter = _format_analytics_results_csv
     elif output_format == "json":
         formatter = _format_analytics_results_json
+    elif output_format == "arrow":
+        formatter = _format_analytics_results_arrow
     else:
         formatter = _format_analytics_results
 
@@ -1258,4 +1729,6 @@ async def query_flight_analytics(
             + formatted
         )
 
-    return formatter(results, analytic_names=display_names)
+    # Formatting many flights is CPU-bound; keep it off the event loop so
+    # other tool calls are not stalled. The formatters share no state.
+    return await asyncio.to_thread(formatter, results, analytic_names=display_names)
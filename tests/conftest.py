@@ -1,44 +1,74 @@
 """Pytest fixtures for EMS MCP Server tests."""
 
+import importlib
 import os
+import pkgutil
+from collections.abc import AsyncGenerator, Generator
 from datetime import datetime, timedelta, timezone
-from typing import Generator
+from typing import Any
 from unittest.mock import patch
 
+import httpx
 import pytest
+from freezegun import freeze_time
 
+import ems_mcp
 from ems_mcp.api.auth import TokenManager
 from ems_mcp.api.client import EMSClient
 from ems_mcp.api.models import CachedToken
 from ems_mcp.config import EMSSettings
 
 
+def _find_lru_caches() -> list[Any]:
+    """Collect every module-level memoized (cache_clear-able) function in ems_mcp."""
+    caches = []
+    for info in pkgutil.walk_packages(ems_mcp.__path__, "ems_mcp."):
+        if info.name.endswith("__main__"):
+            continue
+        module = importlib.import_module(info.name)
+        for obj in vars(module).values():
+            if callable(obj) and hasattr(obj, "cache_clear") and obj not in caches:
+                caches.append(obj)
+    return caches
+
+
+_LRU_CACHES = _find_lru_caches()
+
+
+@pytest.fixture(autouse=True)
+def _clear_lru_caches() -> None:
+    """Clear all lru_caches (get_settings included) before each test."""
+    for cached_fn in _LRU_CACHES:
+        cached_fn.cache_clear()
+
+
+_MOCK_ENV = {
+    "EMS_BASE_URL": "https://test-ems.example.com",
+    "EMS_USERNAME": "testuser",
+    "EMS_PASSWORD": "testpass",
+    "EMS_LOG_LEVEL": "DEBUG",
+}
+
+
 @pytest.fixture
 def mock_env_vars() -> Generator[dict[str, str], None, None]:
     """Set up mock environment variables for testing."""
-    env_vars = {
-        "EMS_BASE_URL": "https://test-ems.example.com",
-        "EMS_USERNAME": "testuser",
-        "EMS_PASSWORD": "testpass",
-        "EMS_LOG_LEVEL": "DEBUG",
-    }
+    env_vars = dict(_MOCK_ENV)
     with patch.dict(os.environ, env_vars, clear=False):
         yield env_vars
 
 
-@pytest.fixture
-def mock_settings(mock_env_vars: dict[str, str]) -> EMSSettings:
-    """Create mock settings for testing."""
-    # Clear the lru_cache before creating new settings
-    from ems_mcp.config import get_settings
-
-    get_settings.cache_clear()
+@pytest.fixture(scope="session")
+def mock_settings() -> EMSSettings:
+    """Create mock settings for testing.
 
+    Built once per session from constant values; tests must not mutate it.
+    """
     return EMSSettings(
-        base_url=mock_env_vars["EMS_BASE_URL"],
-        username=mock_env_vars["EMS_USERNAME"],
-        password=mock_env_vars["EMS_PASSWORD"],
-        log_level=mock_env_vars["EMS_LOG_LEVEL"],
+        base_url=_MOCK_ENV["EMS_BASE_URL"],
+        username=_MOCK_ENV["EMS_USERNAME"],
+        password=_MOCK_ENV["EMS_PASSWORD"],
+        log_level=_MOCK_ENV["EMS_LOG_LEVEL"],
     )
 
 
@@ -55,30 +85,36 @@ def clear_singletons() -> Generator[None, None, None]:
     TokenManager.reset_instance()
     EMSClient.clear_instance()
 
-    # Also clear settings cache
-    from ems_mcp.config import get_settings
 
-    get_settings.cache_clear()
+@pytest.fixture
+def frozen_now() -> Generator[datetime, None, None]:
+    """Freeze the clock for the test and return the frozen UTC instant.
+
+    Every ``datetime.now()`` call, in tests and library code alike, sees the
+    same time, so expiry checks do not depend on how long the test takes.
+    """
+    with freeze_time("2024-01-01T00:00:00Z") as frozen:
+        yield frozen().replace(tzinfo=timezone.utc)
 
 
 @pytest.fixture
-def mock_token() -> CachedToken:
+def mock_token(frozen_now: datetime) -> CachedToken:
     """Create a mock cached token for testing."""
     return CachedToken(
         access_token="mock_access_token_12345",
         token_type="bearer",
-        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        expires_at=frozen_now + timedelta(hours=1),
         base_url="https://test-ems.example.com",
     )
 
 
 @pytest.fixture
-def expired_token() -> CachedToken:
+def expired_token(frozen_now: datetime) -> CachedToken:
     """Create an expired mock token for testing."""
     return CachedToken(
         access_token="expired_token",
         token_type="bearer",
-        expires_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        expires_at=frozen_now - timedelta(hours=1),
         base_url="https://test-ems.example.com",
     )
 
@@ -93,3 +129,32 @@ def token_manager(mock_settings: EMSSettings) -> TokenManager:
 def ems_client(mock_settings: EMSSettings) -> EMSClient:
     """Create an EMSClient instance for testing."""
     return EMSClient(settings=mock_settings)
+
+
+@pytest.fixture(scope="session")
+async def http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """One AsyncClient shared across tests.
+
+    respx.mock patches the transport of every client, so tests stub routes
+    as usual; the client's pool is built once instead of per test.
+    """
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
+@pytest.fixture
+async def mock_api_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """HTTP client wired in-process to the mock EMS API in tests/mock_server.py.
+
+    Requests go through httpx.ASGITransport straight into the FastAPI app, so
+    no uvicorn server or socket is needed. Assign it to an EMSClient's
+    ``_http_client`` to exercise the client against the mock endpoints.
+    """
+    pytest.importorskip("fastapi")
+    from tests.mock_server import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url=_MOCK_ENV["EMS_BASE_URL"]
+    ) as client:
+        yield client
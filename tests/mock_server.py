@@ -4,11 +4,13 @@ Provides a FastAPI-based mock server that simulates EMS API responses
 for unit and integration testing without requiring real credentials.
 """
 
+import json
 from datetime import datetime, timezone
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import FastAPI, Form, HTTPException
+from fastapi import FastAPI, Form, HTTPException, Response
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 
 app = FastAPI(title="Mock EMS API Server")
 
@@ -17,27 +19,37 @@ MOCK_SYSTEMS = [
     {"id": 1, "name": "Production", "description": "Main production EMS system"},
     {"id": 2, "name": "Test", "description": "Testing environment"},
 ]
+MOCK_SYSTEMS_BY_ID = {system["id"]: system for system in MOCK_SYSTEMS}
+
+# The systems list never changes, so encode it once
+_SYSTEMS_BODY = json.dumps(MOCK_SYSTEMS).encode()
 
 VALID_CREDENTIALS = {
     "testuser": "testpass",
     "admin": "adminpass",
 }
+_CRED_SET = frozenset(VALID_CREDENTIALS.items())
+
+
+class TokenRequest(BaseModel):
+    """Form fields of an OAuth password grant."""
+
+    grant_type: str
+    username: str
+    password: str
 
 
 @app.post("/api/token")
-async def token(
-    grant_type: str = Form(...),
-    username: str = Form(...),
-    password: str = Form(...),
-) -> dict[str, Any]:
+async def token(form: Annotated[TokenRequest, Form()]) -> dict[str, Any]:
     """Mock OAuth token endpoint."""
+    grant_type, username, password = form.grant_type, form.username, form.password
     if grant_type != "password":
         raise HTTPException(
             status_code=400,
             detail={"error": "unsupported_grant_type", "error_description": "Only password grant is supported"},
         )
 
-    if username not in VALID_CREDENTIALS or VALID_CREDENTIALS[username] != password:
+    if (username, password) not in _CRED_SET:
         return JSONResponse(
             status_code=400,
             content={
@@ -54,29 +66,28 @@ async def token(
 
 
 @app.get("/api/v2/ems-systems")
-async def list_ems_systems() -> list[dict[str, Any]]:
+async def list_ems_systems() -> Response:
     """Mock EMS systems list endpoint."""
-    return MOCK_SYSTEMS
+    return Response(content=_SYSTEMS_BODY, media_type="application/json")
 
 
 @app.get("/api/v2/ems-systems/{system_id}")
 async def get_ems_system(system_id: int) -> dict[str, Any]:
     """Mock single EMS system endpoint."""
-    for system in MOCK_SYSTEMS:
-        if system["id"] == system_id:
-            return system
+    system = MOCK_SYSTEMS_BY_ID.get(system_id)
+    if system is not None:
+        return system
     raise HTTPException(status_code=404, detail={"message": "EMS system not found"})
 
 
 @app.get("/api/v2/ems-systems/{system_id}/ping")
 async def ping_system(system_id: int) -> dict[str, Any]:
     """Mock EMS system ping endpoint."""
-    for system in MOCK_SYSTEMS:
-        if system["id"] == system_id:
-            return {
-                "serverTime": datetime.now(timezone.utc).isoformat(),
-                "status": "ok",
-            }
+    if system_id in MOCK_SYSTEMS_BY_ID:
+        return {
+            "serverTime": datetime.now(timezone.utc).isoformat(),
+            "status": "ok",
+        }
     raise HTTPException(status_code=404, detail={"message": "EMS system not found"})
 
 
@@ -115,11 +126,16 @@ async def test_server_error() -> JSONResponse:
 
 
 @app.get("/api/v2/test/timeout")
-async def test_timeout() -> dict[str, str]:
-    """Endpoint that simulates a timeout."""
+async def test_timeout(delay: float = 300.0) -> dict[str, str]:
+    """Endpoint that simulates a timeout.
+
+    Args:
+        delay: Seconds to stall before answering. Tests should pass a value
+            just above their client timeout so a missed timeout fails fast.
+    """
     import asyncio
 
-    await asyncio.sleep(300)  # Will be interrupted by client timeout
+    await asyncio.sleep(delay)  # Will be interrupted by client timeout
     return {"status": "ok"}
 
 
@@ -1,5 +1,7 @@
 """Unit tests for EMS MCP asset tools."""
 
+from collections.abc import Iterator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -18,12 +20,29 @@ _get_assets = get_assets.fn
 _ping_system = ping_system.fn
 
 
+@pytest.fixture
+def patched_client() -> Iterator[MagicMock]:
+    """Patch the asset tools' get_client with a mock whose get is awaitable."""
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock()
+    with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
+        yield mock_client
+
+
 class TestAssetFormatters:
     """Tests for asset formatting functions."""
 
-    def test_format_fleets_empty(self) -> None:
-        result = _format_fleets([])
-        assert result == "No fleets found."
+    @pytest.mark.parametrize(
+        ("formatter", "expected"),
+        [
+            (_format_fleets, "No fleets found."),
+            (_format_aircraft, "No aircraft found."),
+            (_format_flight_phases, "No flight phases found."),
+            (_format_airports, "No airports found."),
+        ],
+    )
+    def test_format_empty(self, formatter: Any, expected: str) -> None:
+        assert formatter([]) == expected
 
     def test_format_fleets_multiple(self) -> None:
         fleets = [
@@ -35,10 +54,6 @@ class TestAssetFormatters:
         assert "B737 (ID: 1): Boeing 737" in result
         assert "A320 (ID: 2)" in result
 
-    def test_format_aircraft_empty(self) -> None:
-        result = _format_aircraft([])
-        assert result == "No aircraft found."
-
     def test_format_aircraft_multiple(self) -> None:
         aircraft = [
             {"id": 101, "name": "VH-VXZ", "fleetName": "B737"},
@@ -48,10 +63,6 @@ class TestAssetFormatters:
         assert "Found 2 aircraft:" in result
         assert "VH-VXZ (ID: 101) [Fleet: B737]" in result
 
-    def test_format_flight_phases_empty(self) -> None:
-        result = _format_flight_phases([])
-        assert result == "No flight phases found."
-
     def test_format_flight_phases_multiple(self) -> None:
         phases = [
             {"id": 1, "name": "Takeoff", "description": "Takeoff roll"},
@@ -62,10 +73,6 @@ class TestAssetFormatters:
         assert "Takeoff (ID: 1): Takeoff roll" in result
         assert "Climb (ID: 2)" in result
 
-    def test_format_airports_empty(self) -> None:
-        result = _format_airports([])
-        assert result == "No airports found."
-
     def test_format_airports_multiple(self) -> None:
         airports = [
             {
@@ -99,91 +106,90 @@ class TestAssetFormatters:
 class TestGetAssets:
     """Tests for get_assets consolidated tool."""
 
+    @pytest.mark.parametrize(
+        ("asset_type", "fleet_id", "return_value", "expected_call", "expected_text"),
+        [
+            (
+                "fleets",
+                None,
+                [{"id": 1, "name": "Fleet 1"}],
+                (("/api/v2/ems-systems/1/assets/fleets",), {}),
+                "Fleet 1",
+            ),
+            (
+                "aircraft",
+                10,
+                [{"id": 1, "name": "AC1", "fleetName": "F1"}],
+                (("/api/v2/ems-systems/1/assets/aircraft",), {"params": {"fleetId": 10}}),
+                "AC1",
+            ),
+            (
+                "aircraft",
+                None,
+                [{"id": 1, "name": "AC1", "fleetName": "F1"}],
+                (("/api/v2/ems-systems/1/assets/aircraft",), {"params": {}}),
+                "AC1",
+            ),
+            (
+                "flight_phases",
+                None,
+                [{"id": 1, "name": "Phase 1"}],
+                (("/api/v2/ems-systems/1/assets/flight-phases",), {}),
+                "Phase 1",
+            ),
+            (
+                "airports",
+                None,
+                [{"id": 1, "codeIcao": "YSSY"}],
+                (("/api/v2/ems-systems/1/assets/airports",), {}),
+                "YSSY",
+            ),
+        ],
+        ids=[
+            "fleets",
+            "aircraft_with_fleet_filter",
+            "aircraft_no_fleet_filter",
+            "flight_phases",
+            "airports",
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_get_fleets(self) -> None:
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=[{"id": 1, "name": "Fleet 1"}])
-
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _get_assets(ems_system_id=1, asset_type="fleets")
-
-        assert "Fleet 1" in result
-        mock_client.get.assert_called_once_with("/api/v2/ems-systems/1/assets/fleets")
-
-    @pytest.mark.asyncio
-    async def test_get_aircraft_with_fleet_filter(self) -> None:
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=[{"id": 1, "name": "AC1", "fleetName": "F1"}])
-
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _get_assets(
-                ems_system_id=1, asset_type="aircraft", fleet_id=10
-            )
-
-        assert "AC1" in result
-        mock_client.get.assert_called_once_with(
-            "/api/v2/ems-systems/1/assets/aircraft", params={"fleetId": 10}
-        )
-
-    @pytest.mark.asyncio
-    async def test_get_aircraft_no_fleet_filter(self) -> None:
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=[{"id": 1, "name": "AC1", "fleetName": "F1"}])
-
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _get_assets(ems_system_id=1, asset_type="aircraft")
-
-        assert "AC1" in result
-        mock_client.get.assert_called_once_with(
-            "/api/v2/ems-systems/1/assets/aircraft", params={}
-        )
-
-    @pytest.mark.asyncio
-    async def test_get_flight_phases(self) -> None:
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=[{"id": 1, "name": "Phase 1"}])
-
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _get_assets(ems_system_id=1, asset_type="flight_phases")
-
-        assert "Phase 1" in result
-        mock_client.get.assert_called_once_with("/api/v2/ems-systems/1/assets/flight-phases")
-
-    @pytest.mark.asyncio
-    async def test_get_airports(self) -> None:
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=[{"id": 1, "codeIcao": "YSSY"}])
-
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _get_assets(ems_system_id=1, asset_type="airports")
-
-        assert "YSSY" in result
-        mock_client.get.assert_called_once_with(
-            "/api/v2/ems-systems/1/assets/airports"
-        )
+    async def test_get_asset_type(
+        self,
+        patched_client: MagicMock,
+        asset_type: str,
+        fleet_id: int | None,
+        return_value: list[dict[str, Any]],
+        expected_call: tuple[tuple[Any, ...], dict[str, Any]],
+        expected_text: str,
+    ) -> None:
+        patched_client.get.return_value = return_value
+        kwargs: dict[str, Any] = {"fleet_id": fleet_id} if fleet_id is not None else {}
+
+        result = await _get_assets(ems_system_id=1, asset_type=asset_type, **kwargs)
+
+        assert expected_text in result
+        args, call_kwargs = expected_call
+        patched_client.get.assert_called_once_with(*args, **call_kwargs)
 
     @pytest.mark.asyncio
-    async def test_not_found_error(self) -> None:
+    async def test_not_found_error(self, patched_client: MagicMock) -> None:
         from ems_mcp.api.client import EMSNotFoundError
 
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(side_effect=EMSNotFoundError("Not found"))
+        patched_client.get.side_effect = EMSNotFoundError("Not found")
 
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _get_assets(ems_system_id=999, asset_type="fleets")
+        result = await _get_assets(ems_system_id=999, asset_type="fleets")
 
         assert "Error" in result
         assert "not found" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_api_error(self) -> None:
+    async def test_api_error(self, patched_client: MagicMock) -> None:
         from ems_mcp.api.client import EMSAPIError
 
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(side_effect=EMSAPIError("Server error"))
+        patched_client.get.side_effect = EMSAPIError("Server error")
 
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _get_assets(ems_system_id=1, asset_type="airports")
+        result = await _get_assets(ems_system_id=1, asset_type="airports")
 
         assert "Error" in result
         assert "Server error" in result
@@ -192,63 +198,37 @@ class TestGetAssets:
 class TestPingSystem:
     """Tests for ping_system tool."""
 
+    @pytest.mark.parametrize(
+        ("return_value", "expected"),
+        [
+            (True, ["ONLINE"]),
+            (False, ["OFFLINE"]),
+            ({"message": "All systems go"}, ["ONLINE", "All systems go"]),
+            ("2024-02-05T12:00:00Z", ["ONLINE", "2024-02-05T12:00:00Z"]),
+        ],
+        ids=["bool_true", "bool_false", "dict_response", "string_response"],
+    )
     @pytest.mark.asyncio
-    async def test_ping_system_bool_true(self) -> None:
-        """Ping returning boolean true should show ONLINE."""
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=True)
-
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _ping_system(ems_system_id=1)
-
-        assert "ONLINE" in result
-        mock_client.get.assert_called_once_with("/api/v2/ems-systems/1/ping")
-
-    @pytest.mark.asyncio
-    async def test_ping_system_bool_false(self) -> None:
-        """Ping returning boolean false should show OFFLINE."""
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=False)
-
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _ping_system(ems_system_id=1)
-
-        assert "OFFLINE" in result
-
-    @pytest.mark.asyncio
-    async def test_ping_system_dict_response(self) -> None:
-        """Ping returning a dict should extract message."""
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value={"message": "All systems go"})
-
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _ping_system(ems_system_id=1)
-
-        assert "ONLINE" in result
-        assert "All systems go" in result
-
-    @pytest.mark.asyncio
-    async def test_ping_system_string_response(self) -> None:
-        """Ping returning a string should show it."""
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value="2024-02-05T12:00:00Z")
+    async def test_ping_system_response(
+        self, patched_client: MagicMock, return_value: Any, expected: list[str]
+    ) -> None:
+        """Ping responses should map to ONLINE/OFFLINE with any message shown."""
+        patched_client.get.return_value = return_value
 
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _ping_system(ems_system_id=1)
+        result = await _ping_system(ems_system_id=1)
 
-        assert "ONLINE" in result
-        assert "2024-02-05T12:00:00Z" in result
+        for text in expected:
+            assert text in result
+        patched_client.get.assert_called_once_with("/api/v2/ems-systems/1/ping")
 
     @pytest.mark.asyncio
-    async def test_ping_system_api_error(self) -> None:
+    async def test_ping_system_api_error(self, patched_client: MagicMock) -> None:
         """Ping should handle API errors gracefully."""
         from ems_mcp.api.client import EMSAPIError
 
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(side_effect=EMSAPIError("Server error", status_code=500))
+        patched_client.get.side_effect = EMSAPIError("Server error", status_code=500)
 
-        with patch("ems_mcp.tools.assets.get_client", return_value=mock_client):
-            result = await _ping_system(ems_system_id=1)
+        result = await _ping_system(ems_system_id=1)
 
         assert "OFFLINE" in result
         assert "Server error" in result
@@ -1,5 +1,6 @@
 """Unit tests for authentication and token management."""
 
+import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
@@ -11,38 +12,57 @@ from ems_mcp.api.auth import AuthenticationError, TokenManager
 from ems_mcp.api.models import CachedToken
 from ems_mcp.config import EMSSettings
 
+_TOKEN_URL = "https://test-ems.example.com/api/token"
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Token endpoint bodies, encoded once at import rather than in every test
+_TOKEN_BODIES = {
+    access_token: json.dumps(
+        {"access_token": access_token, "token_type": "bearer", "expires_in": 1799}
+    ).encode()
+    for access_token in ("new_token_123", "cached_token", "new_token")
+}
+
+
+def _mock_token_endpoint(access_token: str) -> respx.Route:
+    """Stub the token endpoint to issue ``access_token`` on every call."""
+    return respx.post(_TOKEN_URL).respond(
+        200, content=_TOKEN_BODIES[access_token], headers=_JSON_HEADERS
+    )
+
+
+def _fresh_manager(settings: EMSSettings) -> TokenManager:
+    """Replace the TokenManager singleton with one built from ``settings``."""
+    manager = TokenManager(settings=settings)
+    TokenManager.set_instance(manager)
+    return manager
+
 
 class TestCachedToken:
     """Tests for CachedToken model."""
 
-    def test_is_valid_with_fresh_token(self) -> None:
+    def test_is_valid_with_fresh_token(self, mock_token: CachedToken) -> None:
         """Fresh token should be valid."""
-        token = CachedToken(
-            access_token="test",
-            token_type="bearer",
-            expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
-            base_url="https://example.com",
-        )
-        assert token.is_valid()
+        assert mock_token.is_valid()
 
-    def test_is_valid_respects_buffer(self) -> None:
+    def test_is_valid_respects_buffer(self, frozen_now: datetime) -> None:
         """Token expiring within buffer should be invalid."""
         # Token expires in 30 seconds, buffer is 60 seconds
         token = CachedToken(
             access_token="test",
             token_type="bearer",
-            expires_at=datetime.now(timezone.utc) + timedelta(seconds=30),
+            expires_at=frozen_now + timedelta(seconds=30),
             base_url="https://example.com",
         )
         assert not token.is_valid(buffer_seconds=60)
 
-    def test_is_valid_with_custom_buffer(self) -> None:
+    def test_is_valid_with_custom_buffer(self, frozen_now: datetime) -> None:
         """Token should respect custom buffer value."""
         # Token expires in 30 seconds
         token = CachedToken(
             access_token="test",
             token_type="bearer",
-            expires_at=datetime.now(timezone.utc) + timedelta(seconds=30),
+            expires_at=frozen_now + timedelta(seconds=30),
             base_url="https://example.com",
         )
         # Should be valid with 10 second buffer
@@ -50,15 +70,9 @@ class TestCachedToken:
         # Should be invalid with 60 second buffer
         assert not token.is_valid(buffer_seconds=60)
 
-    def test_is_valid_with_expired_token(self) -> None:
+    def test_is_valid_with_expired_token(self, expired_token: CachedToken) -> None:
         """Expired token should be invalid."""
-        token = CachedToken(
-            access_token="test",
-            token_type="bearer",
-            expires_at=datetime.now(timezone.utc) - timedelta(hours=1),
-            base_url="https://example.com",
-        )
-        assert not token.is_valid()
+        assert not expired_token.is_valid()
 
 
 class TestTokenManager:
@@ -74,19 +88,20 @@ class TestTokenManager:
         )
 
     @pytest.fixture
-    def token_manager(self, settings: EMSSettings) -> TokenManager:
+    def token_manager(
+        self, settings: EMSSettings, http_client: httpx.AsyncClient
+    ) -> TokenManager:
         """Create a TokenManager for testing."""
         TokenManager.reset_instance()
-        return TokenManager(settings=settings)
+        return TokenManager(settings=settings, http_client=http_client)
 
     @pytest.mark.asyncio
     async def test_get_instance_returns_singleton(
         self, settings: EMSSettings
     ) -> None:
         """get_instance should return the same instance."""
-        TokenManager.reset_instance()
         # Pre-create instance with settings to avoid env var lookup
-        TokenManager._instance = TokenManager(settings=settings)
+        _fresh_manager(settings)
         instance1 = await TokenManager.get_instance()
         instance2 = await TokenManager.get_instance()
         assert instance1 is instance2
@@ -97,11 +112,11 @@ class TestTokenManager:
         self, settings: EMSSettings
     ) -> None:
         """reset_instance should clear the singleton."""
-        TokenManager.reset_instance()
-        TokenManager._instance = TokenManager(settings=settings)
+        _fresh_manager(settings)
         instance1 = await TokenManager.get_instance()
         TokenManager.reset_instance()
-        TokenManager._instance = TokenManager(settings=settings)
+        assert TokenManager._instance is None
+        _fresh_manager(settings)
         instance2 = await TokenManager.get_instance()
         assert instance1 is not instance2
         TokenManager.reset_instance()
@@ -112,19 +127,12 @@ class TestTokenManager:
         self, token_manager: TokenManager
     ) -> None:
         """get_token should request a new token when cache is empty."""
-        respx.post("https://test-ems.example.com/api/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "new_token_123",
-                    "token_type": "bearer",
-                    "expires_in": 1799,
-                },
-            )
-        )
+        _mock_token_endpoint("new_token_123")
 
         token = await token_manager.get_token()
         assert token == "new_token_123"
+        # The shared client belongs to the caller and must stay open
+        assert not token_manager._http_client.is_closed
 
     @pytest.mark.asyncio
     @respx.mock
@@ -133,16 +141,7 @@ class TestTokenManager:
     ) -> None:
         """get_token should return cached token if valid."""
         # First request gets a new token
-        respx.post("https://test-ems.example.com/api/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "cached_token",
-                    "token_type": "bearer",
-                    "expires_in": 1799,
-                },
-            )
-        )
+        _mock_token_endpoint("cached_token")
 
         token1 = await token_manager.get_token()
         token2 = await token_manager.get_token()
@@ -165,16 +164,7 @@ class TestTokenManager:
             base_url="https://test-ems.example.com",
         )
 
-        respx.post("https://test-ems.example.com/api/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "new_token",
-                    "token_type": "bearer",
-                    "expires_in": 1799,
-                },
-            )
-        )
+        _mock_token_endpoint("new_token")
 
         token = await token_manager.get_token()
         assert token == "new_token"
@@ -185,7 +175,7 @@ class TestTokenManager:
         self, token_manager: TokenManager
     ) -> None:
         """get_token should raise AuthenticationError on invalid credentials."""
-        respx.post("https://test-ems.example.com/api/token").mock(
+        respx.post(_TOKEN_URL).mock(
             return_value=httpx.Response(
                 400,
                 json={
@@ -207,7 +197,7 @@ class TestTokenManager:
         self, token_manager: TokenManager
     ) -> None:
         """get_token should raise AuthenticationError on network failure."""
-        respx.post("https://test-ems.example.com/api/token").mock(
+        respx.post(_TOKEN_URL).mock(
             side_effect=httpx.ConnectError("Connection refused")
         )
 
@@ -255,16 +245,7 @@ class TestTokenManager:
             base_url="https://different-ems.example.com",
         )
 
-        respx.post("https://test-ems.example.com/api/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "new_token",
-                    "token_type": "bearer",
-                    "expires_in": 1799,
-                },
-            )
-        )
+        _mock_token_endpoint("new_token")
 
         token = await token_manager.get_token()
         assert token == "new_token"
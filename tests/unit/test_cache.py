@@ -1,41 +1,29 @@
 """Unit tests for caching infrastructure."""
 
-from datetime import datetime, timedelta, timezone
+import asyncio
 
 import pytest
 
-from ems_mcp.cache import CacheEntry, SimpleCache, make_cache_key
+from ems_mcp.cache import SimpleCache, make_cache_key, singleflight
 
 
-class TestCacheEntry:
-    """Tests for CacheEntry dataclass."""
+class _VirtualClock:
+    """Nanosecond clock that only moves when advanced."""
 
-    def test_is_expired_false_for_fresh_entry(self) -> None:
-        """Fresh cache entry should not be expired."""
-        entry = CacheEntry(
-            value="test",
-            expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
-        )
-        assert not entry.is_expired
+    def __init__(self) -> None:
+        self.now_ns = 0
 
-    def test_is_expired_true_for_old_entry(self) -> None:
-        """Old cache entry should be expired."""
-        entry = CacheEntry(
-            value="test",
-            expires_at=datetime.now(timezone.utc) - timedelta(hours=1),
-        )
-        assert entry.is_expired
+    def __call__(self) -> int:
+        return self.now_ns
 
-    def test_created_at_defaults_to_now(self) -> None:
-        """created_at should default to approximately now."""
-        before = datetime.now(timezone.utc)
-        entry = CacheEntry(
-            value="test",
-            expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
-        )
-        after = datetime.now(timezone.utc)
+    def advance(self, seconds: float) -> None:
+        self.now_ns += int(seconds * 1_000_000_000)
 
-        assert before <= entry.created_at <= after
+
+@pytest.fixture
+def virtual_clock() -> _VirtualClock:
+    """Virtual clock for driving SimpleCache expiry without sleeping."""
+    return _VirtualClock()
 
 
 class TestSimpleCache:
@@ -57,18 +45,56 @@ class TestSimpleCache:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_get_returns_none_for_expired_entry(self) -> None:
+    async def test_get_returns_none_for_expired_entry(
+        self, virtual_clock: _VirtualClock
+    ) -> None:
         """Should return None and remove expired entries."""
-        cache: SimpleCache[str] = SimpleCache(default_ttl=1)
-        await cache.set("key", "value", ttl=0)  # Immediately expired
+        cache: SimpleCache[str] = SimpleCache(default_ttl=1, clock=virtual_clock)
+        await cache.set("key", "value")
+        assert await cache.get("key") == "value"
 
-        # Wait a tiny bit to ensure expiry
-        import asyncio
-        await asyncio.sleep(0.01)
+        virtual_clock.advance(1)
 
         result = await cache.get("key")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_entry_served_until_ttl_elapses(
+        self, virtual_clock: _VirtualClock
+    ) -> None:
+        """Expiry should follow the injected clock, not wall time."""
+        cache: SimpleCache[str] = SimpleCache(default_ttl=10, clock=virtual_clock)
+        await cache.set("key", "value")
+
+        virtual_clock.advance(9)
+        assert await cache.get("key") == "value"
+
+        virtual_clock.advance(1)
+        assert await cache.get("key") is None
+        assert cache.size == 0
+
+    @pytest.mark.asyncio
+    async def test_sweep_removes_expired_entries_without_get(
+        self, virtual_clock: _VirtualClock
+    ) -> None:
+        """Expired entries should be swept without being read."""
+        cache: SimpleCache[str] = SimpleCache(clock=virtual_clock)
+        await cache.set("short1", "value", ttl=1)
+        await cache.set("short2", "value", ttl=1)
+        await cache.set("long", "value", ttl=3600)
+
+        virtual_clock.advance(2)
+
+        assert await cache.sweep() == 2
+        assert cache.size == 1
+
+        # An overwritten key must not be swept by its old expiry
+        await cache.set("key", "old", ttl=1)
+        await cache.set("key", "new", ttl=3600)
+        virtual_clock.advance(2)
+        await cache.set("other", "value")
+        assert await cache.get("key") == "new"
+
     @pytest.mark.asyncio
     async def test_delete_removes_entry(self) -> None:
         """Should remove entry on delete."""
@@ -101,14 +127,13 @@ class TestSimpleCache:
         assert cache.size == 0
 
     @pytest.mark.asyncio
-    async def test_custom_ttl(self) -> None:
+    async def test_custom_ttl(self, virtual_clock: _VirtualClock) -> None:
         """Should respect custom TTL per entry."""
-        cache: SimpleCache[str] = SimpleCache(default_ttl=3600)
+        cache: SimpleCache[str] = SimpleCache(default_ttl=3600, clock=virtual_clock)
         await cache.set("long", "value", ttl=3600)
-        await cache.set("short", "value", ttl=0)
+        await cache.set("short", "value", ttl=60)
 
-        import asyncio
-        await asyncio.sleep(0.01)
+        virtual_clock.advance(60)
 
         assert await cache.get("long") == "value"
         assert await cache.get("short") is None
@@ -139,11 +164,25 @@ class TestSimpleCache:
 
         assert cache.size == 5
 
-        # Add one more, should trigger eviction
+        # Add one more, should evict exactly the least recently used entry
+        await cache.set("new_key", "new_value")
+
+        assert cache.size == 5
+        assert await cache.get("key0") is None
+        assert await cache.get("new_key") == "new_value"
+
+    @pytest.mark.asyncio
+    async def test_eviction_keeps_recently_read_entries(self) -> None:
+        """Reading an entry should protect it from the next eviction."""
+        cache: SimpleCache[str] = SimpleCache(max_entries=3)
+        for i in range(3):
+            await cache.set(f"key{i}", f"value{i}")
+
+        assert await cache.get("key0") == "value0"
         await cache.set("new_key", "new_value")
 
-        # Size should be reduced (eviction removes 10% = 0.5, so at least 1)
-        assert cache.size <= 5
+        assert await cache.get("key0") == "value0"
+        assert await cache.get("key1") is None
 
     @pytest.mark.asyncio
     async def test_stores_complex_types(self) -> None:
@@ -157,6 +196,36 @@ class TestSimpleCache:
         assert result == data
 
 
+class TestSingleflight:
+    """Tests for the singleflight helper."""
+
+    @pytest.mark.asyncio
+    async def test_waiter_completes_when_leader_is_cancelled(self) -> None:
+        """A cancelled leader should not cancel callers sharing its lookup."""
+        calls = 0
+        started = asyncio.Event()
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                started.set()
+                await asyncio.Event().wait()  # Hang until cancelled
+            return "value"
+
+        leader = asyncio.create_task(singleflight("k", fetch))
+        await started.wait()
+        waiter = asyncio.create_task(singleflight("k", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await waiter == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert calls == 2
+
+
 class TestMakeCacheKey:
     """Tests for make_cache_key helper function."""
 
@@ -179,3 +248,17 @@ class TestMakeCacheKey:
         """Should handle no arguments."""
         key = make_cache_key()
         assert key == ""
+
+    def test_repeated_args_return_same_string(self) -> None:
+        """Identical arguments should return the memoized key object."""
+        assert make_cache_key("a", "b") is make_cache_key("a", "b")
+
+    def test_equal_values_of_different_types_stay_distinct(self) -> None:
+        """Memoization should not conflate 1, 1.0 and True."""
+        assert make_cache_key(1) == "1"
+        assert make_cache_key(True) == "True"
+        assert make_cache_key(1.0) == "1.0"
+
+    def test_unhashable_args(self) -> None:
+        """Should still build keys from unhashable arguments."""
+        assert make_cache_key("ids", [1, 2]) == "ids:[1, 2]"
@@ -1,11 +1,15 @@
 """Unit tests for EMS API HTTP client."""
 
+import asyncio
+import json
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 import respx
+from pydantic import ValidationError
 
 from ems_mcp.api.auth import AuthenticationError, TokenManager
 from ems_mcp.api.client import (
@@ -19,6 +23,8 @@ from ems_mcp.api.client import (
 from ems_mcp.api.models import CachedToken, RetryConfig
 from ems_mcp.config import EMSSettings
 
+ClientFactory = Callable[..., EMSClient]
+
 
 class TestRetryConfig:
     """Tests for RetryConfig model."""
@@ -47,6 +53,14 @@ class TestRetryConfig:
         assert config.get_delay(0) == 1.0
         assert config.get_delay(10) == 5.0  # Capped at max_delay
 
+    def test_get_delay_beyond_precomputed_attempts(self) -> None:
+        """Attempts past max_retries should still follow the backoff curve."""
+        config = RetryConfig(max_retries=1, max_delay=30.0, jitter=False)
+
+        assert config.get_delay(1) == 2.0
+        assert config.get_delay(4) == 16.0
+        assert config.get_delay(10) == 30.0
+
     def test_get_delay_with_jitter(self) -> None:
         """get_delay with jitter should return values in expected range."""
         config = RetryConfig(jitter=True)
@@ -55,6 +69,14 @@ class TestRetryConfig:
         delays = [config.get_delay(0) for _ in range(100)]
         assert all(0.5 <= d <= 1.5 for d in delays)
 
+    def test_is_frozen(self) -> None:
+        """Fields cannot change after the delays are precomputed."""
+        config = RetryConfig(jitter=False)
+
+        with pytest.raises(ValidationError):
+            config.base_delay = 5.0
+        assert config.get_delay(0) == 1.0
+
 
 class TestEMSClient:
     """Tests for EMSClient class."""
@@ -85,6 +107,26 @@ class TestEMSClient:
         manager.clear_token = MagicMock()
         return manager
 
+    @pytest.fixture
+    def make_client(
+        self,
+        settings: EMSSettings,
+        mock_token_manager: AsyncMock,
+        http_client: httpx.AsyncClient,
+    ) -> ClientFactory:
+        """Build EMSClients wired to the shared HTTP client and mock token manager."""
+
+        def factory(retry_config: RetryConfig | None = None) -> EMSClient:
+            client = EMSClient(
+                settings=settings,
+                token_manager=mock_token_manager,
+                retry_config=retry_config,
+            )
+            client._http_client = http_client
+            return client
+
+        return factory
+
     @pytest.mark.asyncio
     async def test_create_context_manager(self, settings: EMSSettings) -> None:
         """EMSClient.create() should work as async context manager."""
@@ -116,7 +158,7 @@ class TestEMSClient:
     @pytest.mark.asyncio
     @respx.mock
     async def test_get_request_success(
-        self, settings: EMSSettings, mock_token_manager: AsyncMock
+        self, make_client: ClientFactory
     ) -> None:
         """GET request should return parsed JSON on success."""
         respx.get("https://test-ems.example.com/api/v2/ems-systems").mock(
@@ -125,38 +167,79 @@ class TestEMSClient:
             )
         )
 
+        client = make_client()
+
+        result = await client.get("/api/v2/ems-systems")
+        assert result == [{"id": 1, "name": "Test System"}]
+
+    @pytest.mark.asyncio
+    async def test_requests_against_mock_server(
+        self,
+        settings: EMSSettings,
+        mock_token_manager: AsyncMock,
+        mock_api_client: httpx.AsyncClient,
+    ) -> None:
+        """Client should work end-to-end against the in-process mock API."""
         client = EMSClient(settings=settings, token_manager=mock_token_manager)
-        client._http_client = httpx.AsyncClient()
+        client._http_client = mock_api_client
 
-        try:
-            result = await client.get("/api/v2/ems-systems")
-            assert result == [{"id": 1, "name": "Test System"}]
-        finally:
-            await client._http_client.aclose()
+        system = await client.get("/api/v2/ems-systems/1")
+        assert system["name"] == "Production"
+        with pytest.raises(EMSNotFoundError):
+            await client.get("/api/v2/ems-systems/99")
+
+    @pytest.mark.asyncio
+    async def test_mock_timeout_endpoint_honours_delay(
+        self, mock_api_client: httpx.AsyncClient
+    ) -> None:
+        """The stalled endpoint should time out fast and answer once it wakes."""
+        # ASGITransport ignores httpx timeouts, so bound the wait on the loop
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.1):
+                await mock_api_client.get("/api/v2/test/timeout", params={"delay": 0.5})
+
+        response = await mock_api_client.get("/api/v2/test/timeout", params={"delay": 0})
+        assert response.json() == {"status": "ok"}
 
     @pytest.mark.asyncio
     @respx.mock
     async def test_post_request_success(
-        self, settings: EMSSettings, mock_token_manager: AsyncMock
+        self, make_client: ClientFactory
     ) -> None:
         """POST request should send JSON and return parsed response."""
         respx.post("https://test-ems.example.com/api/v2/query").mock(
             return_value=httpx.Response(200, json={"rows": []})
         )
 
-        client = EMSClient(settings=settings, token_manager=mock_token_manager)
-        client._http_client = httpx.AsyncClient()
+        client = make_client()
+
+        result = await client.post("/api/v2/query", json={"select": []})
+        assert result == {"rows": []}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_post_falls_back_for_bodies_orjson_rejects(
+        self, make_client: ClientFactory
+    ) -> None:
+        """Bodies orjson cannot encode should still be sent as JSON."""
+        route = respx.post("https://test-ems.example.com/api/v2/query").mock(
+            return_value=httpx.Response(200, json={"rows": []})
+        )
 
-        try:
-            result = await client.post("/api/v2/query", json={"select": []})
-            assert result == {"rows": []}
-        finally:
-            await client._http_client.aclose()
+        client = make_client()
+
+        body = {"value": 2**64, 1: "int key"}
+        result = await client.post("/api/v2/query", json=body)
+        assert result == {"rows": []}
+        assert json.loads(route.calls.last.request.content) == {
+            "value": 2**64,
+            "1": "int key",
+        }
 
     @pytest.mark.asyncio
     @respx.mock
     async def test_handles_401_with_retry(
-        self, settings: EMSSettings, mock_token_manager: AsyncMock
+        self, make_client: ClientFactory, mock_token_manager: AsyncMock
     ) -> None:
         """Client should clear token and retry once on 401."""
         call_count = 0
@@ -172,81 +255,62 @@ class TestEMSClient:
             side_effect=response_callback
         )
 
-        client = EMSClient(settings=settings, token_manager=mock_token_manager)
-        client._http_client = httpx.AsyncClient()
+        client = make_client()
 
-        try:
-            result = await client.get("/api/test")
-            assert result == {"data": "success"}
-            mock_token_manager.clear_token.assert_called_once()
-        finally:
-            await client._http_client.aclose()
+        result = await client.get("/api/test")
+        assert result == {"data": "success"}
+        mock_token_manager.clear_token.assert_called_once()
 
     @pytest.mark.asyncio
     @respx.mock
     async def test_raises_auth_error_on_repeated_401(
-        self, settings: EMSSettings, mock_token_manager: AsyncMock
+        self, make_client: ClientFactory
     ) -> None:
         """Client should raise AuthenticationError if 401 persists after retry."""
         respx.get("https://test-ems.example.com/api/test").mock(
             return_value=httpx.Response(401, json={"message": "Unauthorized"})
         )
 
-        client = EMSClient(settings=settings, token_manager=mock_token_manager)
-        client._http_client = httpx.AsyncClient()
-
-        try:
-            with pytest.raises(AuthenticationError):
-                await client.get("/api/test")
-        finally:
-            await client._http_client.aclose()
-
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_raises_not_found_on_404(
-        self, settings: EMSSettings, mock_token_manager: AsyncMock
-    ) -> None:
-        """Client should raise EMSNotFoundError on 404."""
-        respx.get("https://test-ems.example.com/api/missing").mock(
-            return_value=httpx.Response(
-                404, json={"message": "Resource not found"}
-            )
-        )
-
-        client = EMSClient(settings=settings, token_manager=mock_token_manager)
-        client._http_client = httpx.AsyncClient()
+        client = make_client()
 
-        try:
-            with pytest.raises(EMSNotFoundError) as exc_info:
-                await client.get("/api/missing")
-            assert exc_info.value.status_code == 404
-        finally:
-            await client._http_client.aclose()
+        with pytest.raises(AuthenticationError):
+            await client.get("/api/test")
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("status", "message", "expected_exc"),
+        [
+            (404, "Resource not found", EMSNotFoundError),
+            (403, "Access denied", EMSAuthorizationError),
+            (500, "Server error", EMSServerError),
+        ],
+    )
     @respx.mock
-    async def test_raises_authorization_error_on_403(
-        self, settings: EMSSettings, mock_token_manager: AsyncMock
+    async def test_status_maps_to_exception(
+        self,
+        make_client: ClientFactory,
+        status: int,
+        message: str,
+        expected_exc: type[EMSAPIError],
     ) -> None:
-        """Client should raise EMSAuthorizationError on 403."""
-        respx.get("https://test-ems.example.com/api/forbidden").mock(
-            return_value=httpx.Response(403, json={"message": "Access denied"})
+        """Client should raise the matching EMSAPIError subclass for each status."""
+        route = respx.get("https://test-ems.example.com/api/resource").mock(
+            return_value=httpx.Response(status, json={"message": message})
         )
 
-        client = EMSClient(settings=settings, token_manager=mock_token_manager)
-        client._http_client = httpx.AsyncClient()
+        # No retries, so 5xx fails on the first response like 4xx does
+        client = make_client(RetryConfig(max_retries=0))
 
-        try:
-            with pytest.raises(EMSAuthorizationError) as exc_info:
-                await client.get("/api/forbidden")
-            assert exc_info.value.status_code == 403
-        finally:
-            await client._http_client.aclose()
+        with pytest.raises(expected_exc) as exc_info:
+            await client.get("/api/resource")
+        assert exc_info.value.status_code == status
+        assert exc_info.value.message == message
+        assert route.call_count == 1
 
     @pytest.mark.asyncio
     @respx.mock
     async def test_retries_on_429_with_retry_after(
-        self, settings: EMSSettings, mock_token_manager: AsyncMock
+        self, make_client: ClientFactory
     ) -> None:
         """Client should retry on 429 respecting Retry-After header."""
         call_count = 0
@@ -268,24 +332,16 @@ class TestEMSClient:
 
         # Use minimal retry config for faster tests
         retry_config = RetryConfig(max_retries=3, base_delay=0.1, jitter=False)
-        client = EMSClient(
-            settings=settings,
-            token_manager=mock_token_manager,
-            retry_config=retry_config,
-        )
-        client._http_client = httpx.AsyncClient()
+        client = make_client(retry_config)
 
-        try:
-            result = await client.get("/api/test")
-            assert result == {"data": "success"}
-            assert call_count == 2
-        finally:
-            await client._http_client.aclose()
+        result = await client.get("/api/test")
+        assert result == {"data": "success"}
+        assert call_count == 2
 
     @pytest.mark.asyncio
     @respx.mock
     async def test_retries_on_500_error(
-        self, settings: EMSSettings, mock_token_manager: AsyncMock
+        self, make_client: ClientFactory
     ) -> None:
         """Client should retry on 5xx server errors."""
         call_count = 0
@@ -304,24 +360,49 @@ class TestEMSClient:
         )
 
         retry_config = RetryConfig(max_retries=3, base_delay=0.01, jitter=False)
-        client = EMSClient(
-            settings=settings,
-            token_manager=mock_token_manager,
-            retry_config=retry_config,
+        client = make_client(retry_config)
+
+        result = await client.get("/api/test")
+        assert result == {"data": "success"}
+        assert call_count == 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_post_retry_resends_json_body(
+        self, make_client: ClientFactory
+    ) -> None:
+        """Retried POSTs should resend the same JSON body and headers."""
+        requests: list[httpx.Request] = []
+
+        def response_callback(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) < 2:
+                return httpx.Response(500, json={"message": "Server error"})
+            return httpx.Response(200, json={"rows": []})
+
+        respx.post("https://test-ems.example.com/api/v2/query").mock(
+            side_effect=response_callback
         )
-        client._http_client = httpx.AsyncClient()
 
-        try:
-            result = await client.get("/api/test")
-            assert result == {"data": "success"}
-            assert call_count == 3
-        finally:
-            await client._http_client.aclose()
+        retry_config = RetryConfig(max_retries=3, base_delay=0.01, jitter=False)
+        client = make_client(retry_config)
+
+        result = await client.post(
+            "/api/v2/query",
+            json={"select": [], "top": 10},
+            headers={"X-Test": "1"},
+        )
+        assert result == {"rows": []}
+        assert len(requests) == 2
+        for request in requests:
+            assert json.loads(request.content) == {"select": [], "top": 10}
+            assert request.headers["Content-Type"] == "application/json"
+            assert request.headers["X-Test"] == "1"
 
     @pytest.mark.asyncio
     @respx.mock
     async def test_raises_after_max_retries(
-        self, settings: EMSSettings, mock_token_manager: AsyncMock
+        self, make_client: ClientFactory
     ) -> None:
         """Client should raise error after exhausting retries."""
         respx.get("https://test-ems.example.com/api/test").mock(
@@ -329,37 +410,25 @@ class TestEMSClient:
         )
 
         retry_config = RetryConfig(max_retries=2, base_delay=0.01, jitter=False)
-        client = EMSClient(
-            settings=settings,
-            token_manager=mock_token_manager,
-            retry_config=retry_config,
-        )
-        client._http_client = httpx.AsyncClient()
+        client = make_client(retry_config)
 
-        try:
-            with pytest.raises(EMSServerError):
-                await client.get("/api/test")
-        finally:
-            await client._http_client.aclose()
+        with pytest.raises(EMSServerError):
+            await client.get("/api/test")
 
     @pytest.mark.asyncio
     @respx.mock
     async def test_handles_empty_response(
-        self, settings: EMSSettings, mock_token_manager: AsyncMock
+        self, make_client: ClientFactory
     ) -> None:
         """Client should handle empty response body."""
         respx.delete("https://test-ems.example.com/api/resource").mock(
             return_value=httpx.Response(204, content=b"")
         )
 
-        client = EMSClient(settings=settings, token_manager=mock_token_manager)
-        client._http_client = httpx.AsyncClient()
+        client = make_client()
 
-        try:
-            result = await client._request("DELETE", "/api/resource")
-            assert result is None
-        finally:
-            await client._http_client.aclose()
+        result = await client._request("DELETE", "/api/resource")
+        assert result is None
 
     @pytest.mark.asyncio
     async def test_raises_without_initialization(
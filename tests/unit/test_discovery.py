@@ -3,8 +3,12 @@
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+import respx
 
+from ems_mcp.api.client import EMSClient
+from ems_mcp.config import EMSSettings
 from ems_mcp.tools.discovery import (
     _do_browse_fields,
     _do_search_fields,
@@ -299,6 +303,12 @@ class TestFormatters:
 class TestListEmsSystems:
     """Tests for list_ems_systems tool."""
 
+    @pytest.fixture(autouse=True)
+    async def clear_cache(self) -> None:
+        """Clear database cache before each test."""
+        from ems_mcp.cache import database_cache
+        await database_cache.clear()
+
     @pytest.mark.asyncio
     async def test_list_ems_systems_success(self) -> None:
         """Tool should return formatted list of systems."""
@@ -331,6 +341,19 @@ class TestListEmsSystems:
         assert "Error listing EMS systems" in result
         assert "Connection failed" in result
 
+    @pytest.mark.asyncio
+    async def test_list_ems_systems_uses_cache(self) -> None:
+        """Tool should use cached results."""
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=[{"id": 1, "name": "Production"}])
+
+        with patch("ems_mcp.tools.discovery.get_client", return_value=mock_client):
+            await _list_ems_systems()
+            result = await _list_ems_systems()
+
+        assert "Production" in result
+        assert mock_client.get.call_count == 1
+
 
 class TestListDatabases:
     """Tests for list_databases tool."""
@@ -832,6 +855,27 @@ class TestSearchAnalytics:
             params={"text": "speed", "groupId": "airspeed-group"},
         )
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_search_analytics_sends_group_id_on_the_wire(
+        self, mock_settings: EMSSettings, http_client: httpx.AsyncClient
+    ) -> None:
+        """The groupId filter should reach the request URL alongside the text."""
+        route = respx.get("https://test-ems.example.com/api/v2/ems-systems/1/analytics").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        token_manager = MagicMock()
+        token_manager.get_token = AsyncMock(return_value="mock_token")
+        token_manager.get_auth_headers = MagicMock(return_value={})
+        client = EMSClient(settings=mock_settings, token_manager=token_manager)
+        client._http_client = http_client
+
+        with patch("ems_mcp.tools.discovery.get_client", return_value=client):
+            await _search_analytics(ems_system_id=1, search_text="alt", group_id="a:b")
+
+        assert route.call_count == 1
+        assert dict(route.calls.last.request.url.params) == {"text": "alt", "groupId": "a:b"}
+
     @pytest.mark.asyncio
     async def test_search_analytics_respects_max_results(self) -> None:
         """Tool should limit results to max_results."""
@@ -1127,9 +1171,9 @@ class TestRecursiveFieldSearch:
                 "id": "g", "name": "Group",
                 "fields": [],
                 "groups": [
-                    {"id": f"sub-a-{id(path)}", "name": "Sub A"},
-                    {"id": f"sub-b-{id(path)}", "name": "Sub B"},
-                    {"id": f"sub-c-{id(path)}", "name": "Sub C"},
+                    {"id": f"sub-a-{path}", "name": "Sub A"},
+                    {"id": f"sub-b-{path}", "name": "Sub B"},
+                    {"id": f"sub-c-{path}", "name": "Sub C"},
                 ],
             }
 
@@ -1186,6 +1230,42 @@ class TestRecursiveFieldSearch:
         # "Flight Information" should have been visited before "Other Stuff"
         assert visit_order.index("flight") < visit_order.index("other")
 
+    @pytest.mark.asyncio
+    async def test_visits_shared_group_once(self) -> None:
+        """A group linked from several parents should only be fetched once."""
+        mock_client = MagicMock()
+        fetched: list[str] = []
+
+        def mock_get(path: str, **kwargs: Any) -> Any:
+            if "groupId=" not in path:
+                return {
+                    "id": "[none]", "name": "Root",
+                    "fields": [],
+                    "groups": [{"id": "a", "name": "A"}, {"id": "b", "name": "B"}],
+                }
+            gid = path.split("groupId=")[1]
+            fetched.append(gid)
+            if gid in ("a", "b"):
+                return {
+                    "id": gid, "name": gid.upper(),
+                    "fields": [],
+                    "groups": [{"id": "shared", "name": "Shared"}],
+                }
+            return {
+                "id": "shared", "name": "Shared",
+                "fields": [{"id": "f1", "name": "Fuel Flow", "type": "number"}],
+                "groups": [],
+            }
+
+        mock_client.get = AsyncMock(side_effect=mock_get)
+
+        results, groups_visited = await _recursive_field_search(
+            mock_client, 1, "db", "fuel", max_depth=5, max_results=10, max_groups=50,
+        )
+        assert fetched.count("shared") == 1
+        assert len(results) == 1
+        assert groups_visited == 4  # root + a + b + shared
+
 
 class TestFindFieldsDeep:
     """Tests for find_fields tool in deep mode (formerly search_fields_deep)."""
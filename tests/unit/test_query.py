@@ -1,5 +1,7 @@
 """Unit tests for EMS MCP query tools."""
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -7,6 +9,7 @@ import pytest
 from ems_mcp.tools.query import (
     QueryField,
     _build_analytics_body,
+    _build_frozen_filter,
     _build_query_body,
     _build_single_filter,
     _extract_column_names,
@@ -75,6 +78,25 @@ class TestBuildSingleFilter:
         assert result["operator"] == "like"
         assert result["args"][1]["value"] == "%test%"
 
+    def test_repeated_filter_reuses_result(self) -> None:
+        """Identical filters should be translated once, returning copies."""
+        f = {"field_id": "f1", "operator": "in", "value": [1, 2]}
+        first = _build_single_filter(f)
+        first["args"][1]["value"] = 99
+        second = _build_single_filter(dict(f))
+
+        assert _build_frozen_filter.cache_info().hits == 1
+        assert second["args"][1]["value"] == 1
+
+    def test_equal_but_differently_typed_values_not_shared(self) -> None:
+        """Values that compare equal but differ in type should not collide."""
+        as_int = _build_single_filter({"field_id": "f1", "operator": "equal", "value": 1})
+        as_bool = _build_single_filter(
+            {"field_id": "f1", "operator": "equal", "value": True}
+        )
+        assert as_int["args"][1]["value"] is not True
+        assert as_bool["args"][1]["value"] is True
+
     def test_is_null_operator(self) -> None:
         """isNull is unary - no value arg."""
         result = _build_single_filter({
@@ -450,6 +472,68 @@ class TestQueryDatabase:
         assert "filter" in call_body
         assert call_body["filter"]["operator"] == "equal"
 
+    @pytest.mark.asyncio
+    async def test_too_many_fields_rejected(self) -> None:
+        """Tool should reject oversized field lists before resolving them."""
+        with patch("ems_mcp.tools.query._resolve_field_refs") as mock_resolve:
+            result = await _query_database(
+                ems_system_id=1,
+                database_id="[db]",
+                fields=[{"field_id": f"[f{i}]"} for i in range(101)],
+            )
+        assert "Maximum 100 fields" in result
+        mock_resolve.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fast_query_skips_progress(self) -> None:
+        """Queries finishing quickly should not report progress."""
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value={
+            "header": [{"name": "Col"}],
+            "rows": [["test"]],
+        })
+        ctx = MagicMock()
+        ctx.report_progress = AsyncMock()
+        ctx.info = AsyncMock()
+
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client):
+            await _query_database(
+                ems_system_id=1,
+                database_id="[db]",
+                fields=[{"field_id": "[f1]"}],
+                filters=[{"field_id": "[f2]", "operator": "equal", "value": 42}],
+                ctx=ctx,
+            )
+
+        ctx.report_progress.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_slow_query_reports_progress(self) -> None:
+        """Queries past the progress threshold should report each step."""
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value={
+            "header": [{"name": "Col"}],
+            "rows": [["test"]],
+        })
+        ctx = MagicMock()
+        ctx.report_progress = AsyncMock()
+        ctx.info = AsyncMock()
+
+        with (
+            patch("ems_mcp.tools.query.get_client", return_value=mock_client),
+            patch("ems_mcp.tools.query._PROGRESS_MIN_ELAPSED", 0),
+        ):
+            await _query_database(
+                ems_system_id=1,
+                database_id="[db]",
+                fields=[{"field_id": "[f1]"}],
+                filters=[{"field_id": "[f2]", "operator": "equal", "value": 42}],
+                ctx=ctx,
+            )
+
+        steps = [c.args[0] for c in ctx.report_progress.call_args_list]
+        assert steps == [1, 2, 3]
+
     @pytest.mark.asyncio
     async def test_empty_fields_validation(self) -> None:
         """Tool should reject empty fields list."""
@@ -697,6 +781,41 @@ class TestQueryFlightAnalytics:
         # Should not have the "all failed" prefix
         assert "All" not in result.split("\n")[0]
 
+    @pytest.mark.asyncio
+    async def test_flights_queried_concurrently_in_order(self) -> None:
+        """Flights should be queried concurrently and reported in input order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_post(path: str, json: dict[str, Any]) -> dict[str, Any]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Earlier flights finish last
+            await asyncio.sleep(0.01 if "/flights/100/" in path else 0)
+            in_flight -= 1
+            return {
+                "offsets": [0.0],
+                "results": [{"analyticId": "[-hub-][alt]", "values": [500.0]}],
+            }
+
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(side_effect=fake_post)
+
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client):
+            result = await _query_flight_analytics(
+                ems_system_id=1,
+                flight_ids=[100, 200, 300],
+                analytics=["[-hub-][alt]"],
+            )
+
+        assert max_in_flight > 1
+        assert (
+            result.index("=== Flight 100 ===")
+            < result.index("=== Flight 200 ===")
+            < result.index("=== Flight 300 ===")
+        )
+
     @pytest.mark.asyncio
     async def test_all_flights_fail(self) -> None:
         """Tool should indicate when all flights fail."""
@@ -886,6 +1005,21 @@ class TestResolveAnalytics:
             result = await _resolve_analytics(["Airspeed"], ems_system_id=1)
         assert result == [("Airspeed", "id-1")]
 
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_one_entry(self) -> None:
+        """An identical repeat request should need a single cache lookup."""
+        from ems_mcp.cache import field_cache
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=[{"id": "id-1", "name": "Airspeed"}])
+        names = ["Airspeed", "[-hub-][field][altitude]"]
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client):
+            first = await _resolve_analytics(names, ems_system_id=1)
+            with patch.object(field_cache, "get", wraps=field_cache.get) as spy:
+                second = await _resolve_analytics(names, ems_system_id=1)
+        assert second == first
+        assert spy.await_count == 1
+        mock_client.get.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_name_single_result(self) -> None:
         """Single search result should be used even without exact name match."""
@@ -931,6 +1065,17 @@ class TestResolveAnalytics:
         # API should only be called once
         assert mock_client.get.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_not_found_cached(self) -> None:
+        """Repeated lookups of a missing name should not re-hit the API."""
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=[])
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client):
+            for _ in range(2):
+                with pytest.raises(ValueError, match="Analytic not found"):
+                    await _resolve_analytics(["Nonexistent"], ems_system_id=1)
+        assert mock_client.get.call_count == 1
+
     @pytest.mark.asyncio
     async def test_mixed_names_and_ids(self) -> None:
         """Mix of names and raw IDs should resolve correctly."""
@@ -960,6 +1105,28 @@ class TestResolveAnalytics:
             result = await _resolve_analytics(["airspeed"], ems_system_id=1)
         assert result == [("Airspeed", "id-1")]
 
+    @pytest.mark.asyncio
+    async def test_multiple_misses_keep_order(self) -> None:
+        """Several uncached names should each be searched and keep input order."""
+        async def fake_get(path: str, params: dict[str, str]) -> list[dict[str, str]]:
+            name = params["text"]
+            return [{"id": f"id-{name}", "name": name}]
+
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=fake_get)
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client):
+            result = await _resolve_analytics(
+                ["Airspeed", "[-hub-][field][alt]", "Pitch", "Roll"],
+                ems_system_id=1,
+            )
+        assert result == [
+            ("Airspeed", "id-Airspeed"),
+            ("[-hub-][field][alt]", "[-hub-][field][alt]"),
+            ("Pitch", "id-Pitch"),
+            ("Roll", "id-Roll"),
+        ]
+        assert mock_client.get.call_count == 3
+
 
 class TestFormatAnalyticsResultsWithNames:
     """Tests for _format_analytics_results with analytic_names parameter."""
@@ -1464,6 +1631,45 @@ class TestResolveFilters:
             )
         assert result[0]["value"] == [1, 2]
 
+    @pytest.mark.asyncio
+    async def test_in_filter_mixed_values(self) -> None:
+        """In filter should resolve labels and keep codes with one metadata fetch."""
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value={
+            "id": "f1", "name": "Airport", "type": "discrete",
+            "discreteValues": {"676": "YPKA", "411": "YPKG", "123": "YSSY"},
+        })
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client):
+            result = await _resolve_filters(
+                [{"field_id": "f1", "operator": "in", "value": ["ypka", 411, "YSSY"]}],
+                ems_system_id=1, database_id="db",
+            )
+        assert result[0]["value"] == [676, 411, 123]
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fields_fetched_once_each(self) -> None:
+        """Each distinct field should be fetched once, however many filters use it."""
+        async def fake_get(path: str) -> dict[str, object]:
+            return {
+                "id": path, "name": "Field", "type": "discrete",
+                "discreteValues": [{"value": 1, "label": "A"}, {"value": 2, "label": "B"}],
+            }
+
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=fake_get)
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client):
+            result = await _resolve_filters(
+                [
+                    {"field_id": "f1", "operator": "equal", "value": "A"},
+                    {"field_id": "f2", "operator": "in", "value": ["A", "B"]},
+                    {"field_id": "f1", "operator": "notEqual", "value": "B"},
+                ],
+                ems_system_id=1, database_id="db",
+            )
+        assert [f["value"] for f in result] == [1, [1, 2], 2]
+        assert mock_client.get.call_count == 2
+
     @pytest.mark.asyncio
     async def test_non_resolvable_operators_passthrough(self) -> None:
         """Operators like greaterThan, between should pass through unchanged."""
@@ -1488,6 +1694,16 @@ class TestResolveFilters:
         assert result[0]["value"] == 42
         mock_client.get.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_no_string_values_returns_filters_unchanged(self) -> None:
+        """Filters without string values should be returned as-is."""
+        filters = [
+            {"field_id": "f1", "operator": "equal", "value": 42},
+            {"field_id": "f2", "operator": "in", "value": [1, 2]},
+        ]
+        result = await _resolve_filters(filters, ems_system_id=1, database_id="db")
+        assert result is filters
+
 
 class TestQueryDatabaseDiscreteResolution:
     """Tests for discrete value resolution in query_database tool."""
@@ -1585,6 +1801,41 @@ class TestGetFieldMetadata:
         call_path = mock_client.get.call_args[0][0]
         assert "%5B" in call_path
 
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self) -> None:
+        """Concurrent lookups for the same field should hit the API once."""
+        async def slow_get(path: str) -> dict[str, str]:
+            await asyncio.sleep(0.01)
+            return {"id": "f1", "name": "Test", "type": "string"}
+
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=slow_get)
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client):
+            results = await asyncio.gather(
+                *(_get_field_metadata(1, "db", "f1") for _ in range(3))
+            )
+        assert all(r["name"] == "Test" for r in results)
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_error(self) -> None:
+        """A failed lookup should fail every caller waiting on it."""
+        from ems_mcp.api.client import EMSAPIError
+
+        async def failing_get(path: str) -> dict[str, str]:
+            await asyncio.sleep(0.01)
+            raise EMSAPIError("boom")
+
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=failing_get)
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client):
+            results = await asyncio.gather(
+                *(_get_field_metadata(1, "db", "f1") for _ in range(2)),
+                return_exceptions=True,
+            )
+        assert all(isinstance(r, EMSAPIError) for r in results)
+        assert mock_client.get.call_count == 1
+
 
 class TestExtractColumnNames:
     """Tests for _extract_column_names helper."""
@@ -1694,6 +1945,17 @@ class TestFormatQueryResultsJson:
         assert ": " not in result
         assert ", " not in result
 
+    def test_json_non_ascii_not_escaped(self) -> None:
+        """Non-ASCII text should be emitted as-is, not as \\u escapes."""
+        response = {
+            "header": [{"name": "Airport"}],
+            "rows": [["São Paulo–Guarulhos"]],
+        }
+        fields: list[QueryField] = [{"field_id": "[f1]"}]
+        result = _format_query_results_json(response, fields)
+        assert "São Paulo–Guarulhos" in result
+        assert "\\u" not in result
+
 
 class TestFormatAnalyticsResultsCsv:
     """Tests for _format_analytics_results_csv formatter."""
@@ -1761,7 +2023,21 @@ class TestFormatAnalyticsResultsJson:
         assert len(parsed["flights"]) == 1
         assert parsed["flights"][0]["flight_id"] == 100
         assert parsed["flights"][0]["row_count"] == 2
-        assert parsed["flights"][0]["rows"][0]["Altitude"] == 1000.0
+        assert parsed["flights"][0]["columns"] == ["Offset", "Altitude"]
+        assert parsed["flights"][0]["data"] == [[0.0, 1.0], [1000.0, 1100.0]]
+
+    def test_json_short_analytic_padded(self) -> None:
+        """Analytics with fewer values than offsets should be padded with null."""
+        import json
+        results = [{
+            "flight_id": 100,
+            "data": {
+                "offsets": [0.0, 1.0, 2.0],
+                "results": [{"analyticId": "Alt", "values": [1000.0]}],
+            },
+        }]
+        parsed = json.loads(_format_analytics_results_json(results))
+        assert parsed["flights"][0]["data"][1] == [1000.0, None, None]
 
     def test_json_error_flight(self) -> None:
         """Error flights should include error field."""
@@ -1792,8 +2068,20 @@ class TestFormatAnalyticsResultsJson:
         import json
         result = _format_analytics_results_json([])
         parsed = json.loads(result)
-        assert parsed["flights"] == []
-        assert parsed["warnings"] == []
+        assert parsed == {"flights": []}
+
+    def test_json_no_warnings_key_when_clean(self) -> None:
+        """The warnings key should be omitted when there are none."""
+        import json
+        results = [{
+            "flight_id": 100,
+            "data": {
+                "offsets": [0.0, 1.0],
+                "results": [{"analyticId": "Alt", "values": [1000.0, 1010.0]}],
+            },
+        }]
+        parsed = json.loads(_format_analytics_results_json(results))
+        assert "warnings" not in parsed
 
 
 class TestQueryDatabaseOutputFormat:
@@ -1906,6 +2194,48 @@ class TestQueryFlightAnalyticsOutputFormat:
         assert len(parsed["flights"]) == 1
         assert parsed["flights"][0]["flight_id"] == 100
 
+    @pytest.mark.asyncio
+    async def test_arrow_output(self) -> None:
+        """query_flight_analytics should embed an Arrow IPC stream per flight."""
+        import base64
+        import json
+        pa = pytest.importorskip("pyarrow")
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value={
+            "offsets": [0.0, 1.0],
+            "results": [
+                {"analyticId": "[-hub-][a1]", "values": [500.0, 510.0]},
+            ],
+        })
+
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client):
+            result = await _query_flight_analytics(
+                ems_system_id=1,
+                flight_ids=[100],
+                analytics=["[-hub-][a1]"],
+                output_format="arrow",
+            )
+
+        flight = json.loads(result)["flights"][0]
+        assert flight["row_count"] == 2
+        stream = base64.b64decode(flight["arrow"])
+        table = pa.ipc.open_stream(stream).read_all()
+        assert table.column_names[0] == "Offset"
+        assert table.column(1).to_pylist() == [500.0, 510.0]
+
+    @pytest.mark.asyncio
+    async def test_arrow_output_without_pyarrow(self) -> None:
+        """Arrow output should report the missing optional dependency."""
+        with patch("ems_mcp.tools.query.pa", None):
+            result = await _query_flight_analytics(
+                ems_system_id=1,
+                flight_ids=[1],
+                analytics=["[-hub-][a1]"],
+                output_format="arrow",
+            )
+        assert "Error" in result
+        assert "pyarrow" in result
+
     @pytest.mark.asyncio
     async def test_invalid_output_format(self) -> None:
         """Tool should reject invalid output_format."""
@@ -1977,6 +2307,36 @@ class TestQueryDatabaseFieldResolution:
 
         assert "2024-01-15" in result
 
+    @pytest.mark.asyncio
+    async def test_repeated_field_name_searched_once(self) -> None:
+        """A name used by several fields should be searched for only once."""
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=[
+            {"id": "[-hub-][field][date]", "name": "Flight Date"},
+        ])
+        mock_client.post = AsyncMock(return_value={
+            "header": [{"name": "Flight Date"}, {"name": "Date 2"}],
+            "rows": [["2024-01-15", "2024-01-15"]],
+        })
+
+        with patch("ems_mcp.tools.query.get_client", return_value=mock_client), \
+             patch("ems_mcp.tools.discovery.get_client", return_value=mock_client):
+            await _query_database(
+                ems_system_id=1,
+                database_id="[db]",
+                fields=[
+                    {"field_id": "Flight Date"},
+                    {"field_id": "Flight Date", "alias": "Date 2"},
+                ],
+                order_by=[{"field_id": "Flight Date"}],
+            )
+
+        assert mock_client.get.call_count == 1
+        call_body = mock_client.post.call_args[1]["json"]
+        assert [s["fieldId"] for s in call_body["select"]] == [
+            "[-hub-][field][date]", "[-hub-][field][date]",
+        ]
+
     @pytest.mark.asyncio
     async def test_resolves_database_name(self) -> None:
         """Tool should resolve database names to IDs."""
@@ -2020,6 +2380,20 @@ class TestQueryDatabaseFieldResolution:
         )
         assert "Error resolving field" in result
 
+    @pytest.mark.asyncio
+    async def test_invalid_filter_ref_reports_filter(self) -> None:
+        """A bad reference only used in a filter should be reported as such."""
+        from ems_mcp.tools.discovery import _reset_result_store
+        _reset_result_store()
+
+        result = await _query_database(
+            ems_system_id=1,
+            database_id="[db]",
+            fields=[{"field_id": "[-hub-][field][date]"}],
+            filters=[{"field_id": 999, "operator": "isNull"}],
+        )
+        assert "Error resolving filter field" in result
+
     @pytest.mark.asyncio
     async def test_analytic_ref_rejected(self) -> None:
         """Analytic references should be rejected with helpful error."""
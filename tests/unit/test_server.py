@@ -0,0 +1,35 @@
+"""Unit tests for server startup helpers."""
+
+import sys
+from types import ModuleType
+from unittest.mock import patch
+
+from ems_mcp.server import _event_loop_options, mcp, run
+
+
+class TestEventLoopOptions:
+    """Tests for picking the event loop at startup."""
+
+    def test_default_loop_without_uvloop(self) -> None:
+        """Without uvloop, anyio should get no backend options."""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert _event_loop_options() == {}
+
+    def test_uses_uvloop_when_installed(self) -> None:
+        """With uvloop importable, anyio should be asked to use it."""
+        with patch.dict(sys.modules, {"uvloop": ModuleType("uvloop")}):
+            assert _event_loop_options() == {"use_uvloop": True}
+
+    def test_run_passes_options_to_anyio(self) -> None:
+        """run() should hand the loop options to anyio, not set a policy."""
+        with (
+            patch.dict(sys.modules, {"uvloop": ModuleType("uvloop")}),
+            patch("ems_mcp.server.anyio.run") as anyio_run,
+            patch("asyncio.set_event_loop_policy") as set_policy,
+        ):
+            run()
+
+        anyio_run.assert_called_once_with(
+            mcp.run_async, backend_options={"use_uvloop": True}
+        )
+        set_policy.assert_not_called()